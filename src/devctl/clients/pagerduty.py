@@ -1,11 +1,15 @@
 """PagerDuty API client using httpx."""
 
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 import httpx
 
 from devctl.config import PagerDutyConfig
+from devctl.core.async_utils import gather_with_concurrency, run_sync
 from devctl.core.exceptions import PagerDutyError, AuthenticationError
 from devctl.core.logging import get_logger
 
@@ -13,6 +17,15 @@ logger = get_logger(__name__)
 
 BASE_URL = "https://api.pagerduty.com"
 
+# PagerDuty caps classic pagination at 100 results per page
+PAGE_SIZE = 100
+# Concurrent page fetches, kept low to stay under the REST API rate limit
+MAX_CONCURRENT_PAGES = 8
+
+# In-process cache for service/schedule/escalation policy lookups
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 512
+
 
 class PagerDutyClient:
     """Client for PagerDuty REST API v2."""
@@ -20,6 +33,7 @@ class PagerDutyClient:
     def __init__(self, config: PagerDutyConfig):
         self._config = config
         self._client: httpx.Client | None = None
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
 
     @property
     def client(self) -> httpx.Client:
@@ -67,22 +81,49 @@ class PagerDutyClient:
             return None
 
         except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            try:
-                error_data = e.response.json()
-                error = error_data.get("error", {})
-                message = error.get("message", str(e))
-                errors = error.get("errors", [])
-                if errors:
-                    message = f"{message}: {', '.join(errors)}"
-            except Exception:
-                message = e.response.text or str(e)
-
-            raise PagerDutyError(message, status_code=status_code)
+            raise self._status_error(e)
+
+        except httpx.RequestError as e:
+            raise PagerDutyError(f"Request failed: {e}")
+
+    async def _request_async(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> Any:
+        """Make an API request on an async client."""
+        try:
+            response = await client.request(method, path, **kwargs)
+            response.raise_for_status()
+
+            if response.content:
+                return response.json()
+            return None
+
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(e)
 
         except httpx.RequestError as e:
             raise PagerDutyError(f"Request failed: {e}")
 
+    @staticmethod
+    def _status_error(e: httpx.HTTPStatusError) -> PagerDutyError:
+        """Convert an HTTP status error into a PagerDutyError."""
+        status_code = e.response.status_code
+        try:
+            error_data = e.response.json()
+            error = error_data.get("error", {})
+            message = error.get("message", str(e))
+            errors = error.get("errors", [])
+            if errors:
+                message = f"{message}: {', '.join(errors)}"
+        except Exception:
+            message = e.response.text or str(e)
+
+        return PagerDutyError(message, status_code=status_code)
+
     def get(self, path: str, **kwargs: Any) -> Any:
         """Make a GET request."""
         return self._request("GET", path, **kwargs)
@@ -105,6 +146,34 @@ class PagerDutyClient:
             self._client.close()
             self._client = None
 
+    def _cached(
+        self,
+        key: tuple[Any, ...],
+        fetch: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return a cached lookup result, fetching it when missing or stale."""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < CACHE_TTL_SECONDS:
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        value = fetch()
+        self._cache[key] = (now, value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return value
+
+    def invalidate(self, resource_id: str | None = None) -> None:
+        """Drop cached lookups for a resource ID, or everything if None."""
+        if resource_id is None:
+            self._cache.clear()
+            return
+
+        for key in [k for k in self._cache if k[1] == resource_id]:
+            del self._cache[key]
+
     def __enter__(self) -> "PagerDutyClient":
         return self
 
@@ -122,8 +191,12 @@ class PagerDutyClient:
         until: datetime | None = None,
         limit: int = 25,
     ) -> list[dict[str, Any]]:
-        """List incidents with optional filters."""
-        params: dict[str, Any] = {"limit": limit}
+        """List incidents with optional filters.
+
+        The first page is requested with ``total=true``; when more than one
+        page is needed, the remaining pages are fetched concurrently.
+        """
+        params: dict[str, Any] = {}
 
         if statuses:
             params["statuses[]"] = statuses
@@ -138,8 +211,45 @@ class PagerDutyClient:
         if until:
             params["until"] = until.isoformat()
 
-        result = self.get("/incidents", params=params)
-        return result.get("incidents", [])
+        first_size = min(limit, PAGE_SIZE)
+        result = self.get(
+            "/incidents",
+            params={**params, "limit": first_size, "offset": 0, "total": True},
+        )
+        incidents: list[dict[str, Any]] = result.get("incidents", [])
+
+        end = min(limit, result.get("total") or 0)
+        if not result.get("more") or len(incidents) >= end:
+            return incidents[:limit]
+
+        offsets = range(first_size, end, PAGE_SIZE)
+        for page in run_sync(self._fetch_incident_pages(params, offsets, end)):
+            incidents.extend(page)
+
+        return incidents[:limit]
+
+    async def _fetch_incident_pages(
+        self,
+        params: dict[str, Any],
+        offsets: range,
+        end: int,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch incident pages at the given offsets concurrently."""
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=self.client.headers,
+            timeout=self._config.timeout,
+        ) as client:
+
+            async def fetch_page(offset: int) -> list[dict[str, Any]]:
+                page_params = {**params, "limit": min(PAGE_SIZE, end - offset), "offset": offset}
+                result = await self._request_async(client, "GET", "/incidents", params=page_params)
+                return result.get("incidents", [])
+
+            return await gather_with_concurrency(
+                MAX_CONCURRENT_PAGES,
+                *[fetch_page(offset) for offset in offsets],
+            )
 
     def get_incident(self, incident_id: str) -> dict[str, Any]:
         """Get incident details."""
@@ -183,6 +293,8 @@ class PagerDutyClient:
         result = self.post(
             "/incidents", headers=headers, json={"incident": incident_data}
         )
+        # Service status reflects its open incidents
+        self.invalidate(service_id)
         return result.get("incident", {})
 
     def update_incident(
@@ -225,7 +337,12 @@ class PagerDutyClient:
             headers=headers,
             json={"incident": incident_data},
         )
-        return result.get("incident", {})
+        incident = result.get("incident", {})
+        # Service status reflects its open incidents
+        service_id = incident.get("service", {}).get("id")
+        if service_id:
+            self.invalidate(service_id)
+        return incident
 
     def acknowledge_incident(self, incident_id: str) -> dict[str, Any]:
         """Acknowledge an incident."""
@@ -306,8 +423,11 @@ class PagerDutyClient:
         if until:
             params["until"] = until.isoformat()
 
-        result = self.get(f"/schedules/{schedule_id}", params=params)
-        return result.get("schedule", {})
+        def fetch() -> dict[str, Any]:
+            result = self.get(f"/schedules/{schedule_id}", params=params)
+            return result.get("schedule", {})
+
+        return self._cached(("schedule", schedule_id, since, until), fetch)
 
     # Service operations
     def list_services(
@@ -327,8 +447,12 @@ class PagerDutyClient:
 
     def get_service(self, service_id: str) -> dict[str, Any]:
         """Get service details."""
-        result = self.get(f"/services/{service_id}")
-        return result.get("service", {})
+
+        def fetch() -> dict[str, Any]:
+            result = self.get(f"/services/{service_id}")
+            return result.get("service", {})
+
+        return self._cached(("service", service_id), fetch)
 
     # User operations
     def get_current_user(self) -> dict[str, Any]:
@@ -359,5 +483,9 @@ class PagerDutyClient:
 
     def get_escalation_policy(self, policy_id: str) -> dict[str, Any]:
         """Get escalation policy details."""
-        result = self.get(f"/escalation_policies/{policy_id}")
-        return result.get("escalation_policy", {})
+
+        def fetch() -> dict[str, Any]:
+            result = self.get(f"/escalation_policies/{policy_id}")
+            return result.get("escalation_policy", {})
+
+        return self._cached(("escalation_policy", policy_id), fetch)
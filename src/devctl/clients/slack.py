@@ -1,5 +1,12 @@
 """Slack Web API client using httpx."""
 
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -7,11 +14,19 @@ import httpx
 from devctl.config import SlackConfig
 from devctl.core.exceptions import SlackError, AuthenticationError
 from devctl.core.logging import get_logger
+from devctl.core.utils import get_cache_dir, json_loads
 
 logger = get_logger(__name__)
 
 BASE_URL = "https://slack.com/api"
 
+# users.list page size used by iter_users (Slack recommends <= 200)
+USERS_PAGE_SIZE = 200
+
+# Disk cache for read-only listing endpoints
+CACHE_SUBDIR = "slack"
+CACHE_TTL_SECONDS = 60
+
 
 class SlackClient:
     """Client for Slack Web API."""
@@ -87,6 +102,40 @@ class SlackClient:
         """Make a POST request."""
         return self._request("POST", endpoint, **kwargs)
 
+    def _cached_get(self, endpoint: str, params: dict[str, Any]) -> Any:
+        """GET a listing endpoint through a short-lived disk cache.
+
+        Responses are stored under the devctl cache directory for
+        CACHE_TTL_SECONDS, keyed by a digest of the token, endpoint and
+        params, so repeated listings within a minute (scripts, shell
+        completion) skip the API round trip.
+        """
+        key = hashlib.blake2b(
+            json.dumps([self._config.get_token(), endpoint, params], sort_keys=True).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_file = get_cache_dir() / CACHE_SUBDIR / f"{endpoint}-{key}.json"
+
+        try:
+            if time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS:
+                return json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        result = self.get(endpoint, params=params)
+        _store_cache(cache_file, json.dumps(result).encode())
+        return result
+
+    def invalidate_cache(self, endpoint: str | None = None) -> None:
+        """Drop cached listing responses.
+
+        Args:
+            endpoint: Only drop entries for this endpoint (None for all)
+        """
+        pattern = f"{endpoint}-*.json" if endpoint else "*.json"
+        for cache_file in (get_cache_dir() / CACHE_SUBDIR).glob(pattern):
+            cache_file.unlink(missing_ok=True)
+
     def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
@@ -233,7 +282,7 @@ class SlackClient:
         if cursor:
             params["cursor"] = cursor
 
-        result = self.get("conversations.list", params=params)
+        result = self._cached_get("conversations.list", params)
         return {
             "channels": result.get("channels", []),
             "cursor": result.get("response_metadata", {}).get("next_cursor"),
@@ -254,21 +303,25 @@ class SlackClient:
             "conversations.create",
             json={"name": name, "is_private": is_private},
         )
+        self.invalidate_cache("conversations.list")
         return result.get("channel", {})
 
     def archive_channel(self, channel: str) -> bool:
         """Archive a channel."""
         self.post("conversations.archive", json={"channel": channel})
+        self.invalidate_cache("conversations.list")
         return True
 
     def unarchive_channel(self, channel: str) -> bool:
         """Unarchive a channel."""
         self.post("conversations.unarchive", json={"channel": channel})
+        self.invalidate_cache("conversations.list")
         return True
 
     def join_channel(self, channel: str) -> dict[str, Any]:
         """Join a channel."""
         result = self.post("conversations.join", json={"channel": channel})
+        self.invalidate_cache("conversations.list")
         return result.get("channel", {})
 
     def invite_to_channel(self, channel: str, users: list[str]) -> dict[str, Any]:
@@ -306,12 +359,53 @@ class SlackClient:
         if cursor:
             params["cursor"] = cursor
 
-        result = self.get("users.list", params=params)
+        result = self._cached_get("users.list", params)
         return {
             "members": result.get("members", []),
             "cursor": result.get("response_metadata", {}).get("next_cursor"),
         }
 
+    def iter_users(
+        self,
+        limit: int | None = None,
+        exclude_bots: bool = True,
+        exclude_deleted: bool = True,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterate over workspace users, filtering each page as it arrives.
+
+        Follows the users.list cursor until limit matching users have been
+        yielded (or the listing ends), so filtered-out bots and deleted
+        accounts do not eat into the requested count.
+
+        Args:
+            limit: Maximum number of users to yield (None for all)
+            exclude_bots: Skip bot users
+            exclude_deleted: Skip deactivated users
+
+        Yields:
+            User objects
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        count = 0
+        cursor = None
+        while True:
+            page = self.list_users(limit=USERS_PAGE_SIZE, cursor=cursor)
+            for member in page["members"]:
+                if exclude_bots and member.get("is_bot"):
+                    continue
+                if exclude_deleted and member.get("deleted"):
+                    continue
+                yield member
+                count += 1
+                if count == limit:
+                    return
+
+            cursor = page["cursor"]
+            if not cursor:
+                return
+
     def get_user_info(self, user: str) -> dict[str, Any]:
         """Get user info."""
         result = self.get("users.info", params={"user": user})
@@ -550,3 +644,24 @@ class SlackClient:
             })
 
         return self.post_message(channel, text, blocks=blocks)
+
+
+def _store_cache(cache_file: Path, data: bytes) -> None:
+    """Write a cache entry readable only by the user.
+
+    Listings include user names and emails, so the directory is 0700 and
+    the file 0600. The entry is written to a temporary file and renamed
+    into place, so readers never see partial JSON.
+    """
+    try:
+        cache_file.parent.mkdir(mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cache_file)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
@@ -57,8 +57,8 @@ def metrics(
         # Parse dimensions
         dim_list = []
         for d in dimensions:
-            if "=" in d:
-                name, value = d.split("=", 1)
+            name, sep, value = d.partition("=")
+            if sep:
                 dim_list.append({"Name": name, "Value": value})
 
         if metric:
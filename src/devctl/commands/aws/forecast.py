@@ -97,8 +97,8 @@ def export_metrics(
         # Parse dimensions
         dim_list = []
         for dim in dimensions:
-            if "=" in dim:
-                name, value = dim.split("=", 1)
+            name, sep, value = dim.partition("=")
+            if sep:
                 dim_list.append({"Name": name, "Value": value})
 
         ctx.output.print_info(f"Exporting {namespace}/{metric} for last {days} days...")
@@ -225,8 +225,8 @@ def set_param(
         if tags:
             tag_list = []
             for tag in tags:
-                if "=" in tag:
-                    key, val = tag.split("=", 1)
+                key, sep, val = tag.partition("=")
+                if sep:
                     tag_list.append({"Key": key, "Value": val})
             if tag_list:
                 kwargs["Tags"] = tag_list
@@ -346,8 +346,8 @@ def run_command(
             if target.startswith("tag:"):
                 # Tag-based targeting
                 tag_part = target[4:]  # Remove "tag:"
-                if "=" in tag_part:
-                    key, value = tag_part.split("=", 1)
+                key, sep, value = tag_part.partition("=")
+                if sep:
                     target_list.append({
                         "Key": f"tag:{key}",
                         "Values": [value],
@@ -145,8 +145,8 @@ def trigger_workflow(
     # Parse inputs
     input_dict: dict[str, Any] = {}
     for inp in inputs:
-        if "=" in inp:
-            key, value = inp.split("=", 1)
+        key, sep, value = inp.partition("=")
+        if sep:
             input_dict[key] = value
 
     if ctx.dry_run:
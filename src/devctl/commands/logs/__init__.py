@@ -24,7 +24,7 @@ def logs(ctx: DevCtlContext) -> None:
 @logs.command("search")
 @click.argument("query")
 @click.option("--source", type=click.Choice(["cloudwatch", "loki", "eks", "all"]), default="cloudwatch", help="Log source")
-@click.option("-g", "--log-group", default=None, help="CloudWatch log group")
+@click.option("-g", "--log-group", "log_groups", multiple=True, help="CloudWatch log group (repeatable)")
 @click.option("-n", "--namespace", default=None, help="K8s namespace")
 @click.option("--pod", default=None, help="Pod name")
 @click.option("--since", default="1h", help="Time range (e.g., 1h, 30m, 7d)")
@@ -34,7 +34,7 @@ def search(
     ctx: DevCtlContext,
     query: str,
     source: str,
-    log_group: str | None,
+    log_groups: tuple[str, ...],
     namespace: str | None,
     pod: str | None,
     since: str,
@@ -45,13 +45,14 @@ def search(
     \b
     Examples:
         devctl logs search "error" --source cloudwatch -g /aws/lambda/my-func
+        devctl logs search "error" -g /aws/lambda/api -g /aws/lambda/worker
         devctl logs search "exception" --source loki --namespace production
     """
     try:
         log_query = LogQuery(
             query=query,
             time_range=since,
-            log_group=log_group,
+            log_group=list(log_groups) or None,
             namespace=namespace,
             pod=pod,
             limit=limit,
@@ -159,7 +160,7 @@ def tail(
 
 
 @logs.command("cloudwatch")
-@click.argument("log_group")
+@click.argument("log_groups", nargs=-1, required=True)
 @click.option("--since", default="1h", help="Time range")
 @click.option("--filter", "filter_pattern", default=None, help="Filter pattern")
 @click.option("--insights", default=None, help="CloudWatch Insights query")
@@ -167,17 +168,18 @@ def tail(
 @pass_context
 def cloudwatch(
     ctx: DevCtlContext,
-    log_group: str,
+    log_groups: tuple[str, ...],
     since: str,
     filter_pattern: str | None,
     insights: str | None,
     limit: int,
 ) -> None:
-    """Query CloudWatch logs.
+    """Query CloudWatch logs in one or more log groups.
 
     \b
     Examples:
         devctl logs cloudwatch /aws/lambda/my-func --since 1h
+        devctl logs cloudwatch /aws/lambda/api /aws/lambda/worker --filter ERROR
         devctl logs cloudwatch /aws/ecs/service --insights "fields @timestamp, @message | filter @message like /error/"
     """
     try:
@@ -186,7 +188,7 @@ def cloudwatch(
         log_source = CloudWatchLogSource(logs_client=ctx.aws.logs())
 
         query = LogQuery(
-            log_group=log_group,
+            log_group=list(log_groups),
             time_range=since,
             filter_pattern=filter_pattern,
             query=insights,
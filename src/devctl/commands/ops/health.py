@@ -1,6 +1,13 @@
 """Health check operations."""
 
+import random
+import signal
+import ssl
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
 import click
@@ -8,6 +15,11 @@ import httpx
 
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import DevCtlError
+from devctl.core.utils import json_loads
+
+# Streaming body check tuning for `health url --expected-body`
+_BODY_CHUNK_SIZE = 64 * 1024
+_BODY_SCAN_LIMIT = 1024 * 1024
 
 
 @click.group()
@@ -69,6 +81,17 @@ def check(
         raise DevCtlError(f"Health check failed: {e}")
 
 
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Shared HTTP client for health checks.
+
+    Built on first use so the CA bundle is parsed once per process and
+    connections are reused across `health wait` polls, rather than paying
+    both costs on every request.
+    """
+    return httpx.Client(verify=ssl.create_default_context(), follow_redirects=True)
+
+
 def _check_http(target: str, path: str, timeout: int) -> dict[str, Any]:
     """Perform HTTP health check."""
     url = target if target.startswith("http") else f"https://{target}"
@@ -76,7 +99,7 @@ def _check_http(target: str, path: str, timeout: int) -> dict[str, Any]:
         url = url.rstrip("/") + path
 
     try:
-        response = httpx.get(url, timeout=timeout, follow_redirects=True)
+        response = _http_client().get(url, timeout=timeout)
         healthy = 200 <= response.status_code < 400
 
         return {
@@ -178,39 +201,35 @@ def _check_eks(ctx: DevCtlContext, deployment: str) -> dict[str, Any]:
         deploy_name = deployment
 
     try:
-        cmd = [
-            "kubectl", "get", "deployment", deploy_name,
-            "-n", namespace,
-            "-o", "jsonpath={.status.readyReplicas}/{.spec.replicas}",
-        ]
+        cmd = ["kubectl", "get", "deployment", deploy_name, "-n", namespace, "-o", "json"]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
 
         if result.returncode != 0:
             return {
                 "healthy": False,
-                "message": result.stderr or "kubectl failed",
+                "message": result.stderr.decode(errors="replace") or "kubectl failed",
             }
 
-        output = result.stdout.strip()
-        if "/" in output:
-            ready, total = output.split("/")
-            ready = int(ready) if ready else 0
-            total = int(total) if total else 0
-            healthy = ready >= total and ready > 0
+        try:
+            data = json_loads(result.stdout)
+        except ValueError:
+            return {"healthy": False, "message": "Unexpected kubectl output"}
 
-            return {
-                "healthy": healthy,
-                "message": f"{ready}/{total} pods ready",
-                "details": {
-                    "namespace": namespace,
-                    "deployment": deploy_name,
-                    "ready": ready,
-                    "total": total,
-                },
-            }
+        ready = data.get("status", {}).get("readyReplicas", 0)
+        total = data.get("spec", {}).get("replicas", 0)
+        healthy = ready >= total and ready > 0
 
-        return {"healthy": False, "message": f"Unexpected output: {output}"}
+        return {
+            "healthy": healthy,
+            "message": f"{ready}/{total} pods ready",
+            "details": {
+                "namespace": namespace,
+                "deployment": deploy_name,
+                "ready": ready,
+                "total": total,
+            },
+        }
 
     except subprocess.TimeoutExpired:
         return {"healthy": False, "message": "kubectl timed out"}
@@ -224,6 +243,12 @@ def _check_eks(ctx: DevCtlContext, deployment: str) -> dict[str, Any]:
 @click.option("--timeout", type=int, default=300, help="Total wait timeout in seconds")
 @click.option("--interval", type=int, default=10, help="Check interval in seconds")
 @click.option("--path", default="/health", help="Path for HTTP checks")
+@click.option(
+    "--jitter",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.2,
+    help="Randomize the check interval by this fraction (0 disables)",
+)
 @pass_context
 def wait(
     ctx: DevCtlContext,
@@ -232,32 +257,59 @@ def wait(
     timeout: int,
     interval: int,
     path: str,
+    jitter: float,
 ) -> None:
-    """Wait for a target to become healthy."""
+    """Wait for a target to become healthy.
+
+    The check interval is randomized by +/- --jitter so that concurrent
+    waiters do not probe a recovering backend in lockstep.
+    """
     ctx.output.print_info(f"Waiting for {target} to become healthy (timeout: {timeout}s)...")
 
     start_time = time.time()
 
-    while True:
-        elapsed = time.time() - start_time
-        if elapsed >= timeout:
-            raise DevCtlError(f"Timeout waiting for {target} after {timeout}s")
-
-        if check_type == "http":
-            result = _check_http(target, path, 10)
-        elif check_type == "ecs":
-            result = _check_ecs(ctx, target)
-        elif check_type == "eks":
-            result = _check_eks(ctx, target)
-        else:
-            raise DevCtlError(f"Unsupported check type for wait: {check_type}")
-
-        if result["healthy"]:
-            ctx.output.print_success(f"Target is healthy: {result.get('message', 'OK')}")
-            return
+    with _sigint_event() as stop:
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
+                raise DevCtlError(f"Timeout waiting for {target} after {timeout}s")
+
+            if check_type == "http":
+                result = _check_http(target, path, 10)
+            elif check_type == "ecs":
+                result = _check_ecs(ctx, target)
+            elif check_type == "eks":
+                result = _check_eks(ctx, target)
+            else:
+                raise DevCtlError(f"Unsupported check type for wait: {check_type}")
+
+            if result["healthy"]:
+                ctx.output.print_success(f"Target is healthy: {result.get('message', 'OK')}")
+                return
+
+            ctx.output.print(f"[dim]Not healthy yet ({int(elapsed)}s): {result.get('message', '-')}[/dim]")
+            if stop.wait(interval * random.uniform(1 - jitter, 1 + jitter)):
+                raise click.Abort()
+
+
+@contextmanager
+def _sigint_event() -> Iterator[threading.Event]:
+    """Yield an event that is set on Ctrl+C instead of raising KeyboardInterrupt.
+
+    Waiting on the event rather than calling time.sleep keeps long polling
+    intervals interruptible on every platform. Outside the main thread,
+    where signal handlers cannot be installed, the event is never set.
+    """
+    stop = threading.Event()
+    if threading.current_thread() is not threading.main_thread():
+        yield stop
+        return
 
-        ctx.output.print(f"[dim]Not healthy yet ({int(elapsed)}s): {result.get('message', '-')}[/dim]")
-        time.sleep(interval)
+    previous = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    try:
+        yield stop
+    finally:
+        signal.signal(signal.SIGINT, previous)
 
 
 @health.command("url")
@@ -275,22 +327,30 @@ def check_url(
 ) -> None:
     """Check a specific URL health."""
     try:
-        response = httpx.get(url, timeout=timeout, follow_redirects=True)
+        with _http_client().stream("GET", url, timeout=timeout) as response:
+            status_code = response.status_code
+            body_ok = False
+            if expected_body:
+                needle = expected_body.encode(response.encoding or "utf-8")
+                body_ok = _body_contains(response, needle)
 
-        checks = []
+        checks: list[dict[str, Any]] = []
+        # Bit i is set when check i passed
+        passed_mask = 0
 
         # Status check
-        status_ok = response.status_code == expected_status
+        status_ok = status_code == expected_status
+        passed_mask |= status_ok << len(checks)
         checks.append({
             "Check": "Status Code",
             "Expected": expected_status,
-            "Actual": response.status_code,
+            "Actual": status_code,
             "Result": "[green]PASS[/green]" if status_ok else "[red]FAIL[/red]",
         })
 
         # Body check
         if expected_body:
-            body_ok = expected_body in response.text
+            passed_mask |= body_ok << len(checks)
             checks.append({
                 "Check": "Body Contains",
                 "Expected": expected_body[:30],
@@ -298,8 +358,9 @@ def check_url(
                 "Result": "[green]PASS[/green]" if body_ok else "[red]FAIL[/red]",
             })
 
-        # Response time
+        # Response time (available once the stream is closed)
         response_time = int(response.elapsed.total_seconds() * 1000)
+        passed_mask |= 1 << len(checks)
         checks.append({
             "Check": "Response Time",
             "Expected": "-",
@@ -309,11 +370,37 @@ def check_url(
 
         ctx.output.print_data(checks, headers=["Check", "Expected", "Actual", "Result"], title=f"Health Check: {url}")
 
-        all_passed = all(c.get("Result", "").find("PASS") >= 0 or c.get("Result", "").find("OK") >= 0 for c in checks)
-        if all_passed:
+        if passed_mask == (1 << len(checks)) - 1:
             ctx.output.print_success("All checks passed")
         else:
             ctx.output.print_error("Some checks failed")
 
     except httpx.RequestError as e:
         ctx.output.print_error(f"Request failed: {e}")
+
+
+def _body_contains(
+    response: httpx.Response,
+    needle: bytes,
+    limit: int = _BODY_SCAN_LIMIT,
+) -> bool:
+    """Scan a streamed response body for needle, stopping at the first match.
+
+    Only the trailing len(needle) - 1 bytes are carried between chunks, so
+    memory stays bounded regardless of body size. Scanning gives up after
+    limit bytes.
+    """
+    keep = len(needle) - 1
+    buf = b""
+    total = 0
+
+    for chunk in response.iter_bytes(chunk_size=_BODY_CHUNK_SIZE):
+        buf += chunk
+        if needle in buf:
+            return True
+        total += len(chunk)
+        if total > limit:
+            return False
+        buf = buf[-keep:] if keep else b""
+
+    return False
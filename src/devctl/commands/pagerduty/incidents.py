@@ -1,10 +1,20 @@
 """PagerDuty incident commands."""
 
+import time
+from collections import namedtuple
+from datetime import UTC, datetime
+
 import click
-from datetime import datetime, timedelta
 
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import PagerDutyError
+from devctl.core.output import OutputFormat
+from devctl.core.utils import format_timestamp
+
+IncidentRow = namedtuple("IncidentRow", "id status urgency title service created")
+
+# Seconds per --since unit
+_UNITS = {"h": 3600, "d": 86400, "w": 604800}
 
 
 @click.group()
@@ -54,20 +64,23 @@ def list_incidents(
             ctx.output.print_info("No incidents found")
             return
 
-        rows = []
-        for inc in incidents:
-            rows.append({
-                "id": inc.get("id", ""),
-                "status": inc.get("status", ""),
-                "urgency": inc.get("urgency", ""),
-                "title": _truncate(inc.get("title", ""), 50),
-                "service": inc.get("service", {}).get("summary", ""),
-                "created": _format_time(inc.get("created_at")),
-            })
+        # Titles are only shortened for table output; JSON/YAML keep them intact
+        truncate = ctx.output_format == OutputFormat.TABLE
+        rows = [
+            IncidentRow(
+                inc.get("id", ""),
+                inc.get("status", ""),
+                inc.get("urgency", ""),
+                _truncate(inc.get("title", ""), 50) if truncate else inc.get("title", ""),
+                inc.get("service", {}).get("summary", ""),
+                format_timestamp(inc.get("created_at")),
+            )
+            for inc in incidents
+        ]
 
         ctx.output.print_table(
             rows,
-            columns=["id", "status", "urgency", "title", "service", "created"],
+            columns=list(IncidentRow._fields),
             title="Incidents",
         )
 
@@ -219,33 +232,18 @@ def add_note(ctx: DevCtlContext, incident_id: str, content: str) -> None:
 
 
 def _parse_since(since: str) -> datetime:
-    """Parse since duration string to datetime."""
+    """Parse since duration string to a UTC datetime."""
     value = int(since[:-1])
     unit = since[-1].lower()
 
-    if unit == "h":
-        return datetime.utcnow() - timedelta(hours=value)
-    elif unit == "d":
-        return datetime.utcnow() - timedelta(days=value)
-    elif unit == "w":
-        return datetime.utcnow() - timedelta(weeks=value)
-    else:
+    try:
+        seconds = value * _UNITS[unit]
+    except KeyError:
         raise ValueError(f"Invalid time unit: {unit}")
 
-
-def _format_time(timestamp: str | None) -> str:
-    """Format timestamp for display."""
-    if not timestamp:
-        return ""
-    try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return timestamp
+    return datetime.fromtimestamp(time.time() - seconds, tz=UTC)
 
 
 def _truncate(text: str, max_len: int) -> str:
     """Truncate text with ellipsis."""
-    if len(text) <= max_len:
-        return text
-    return text[: max_len - 3] + "..."
+    return text if len(text) <= max_len else f"{text[: max_len - 1]}\u2026"
@@ -1,9 +1,19 @@
 """PagerDuty on-call commands."""
 
+import operator
+from collections import namedtuple
+
 import click
 
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import PagerDutyError
+from devctl.core.utils import format_timestamp
+
+OnCallRow = namedtuple("OnCallRow", "user email schedule policy level start end")
+
+_ONCALL_KEYS = ("user", "schedule", "escalation_policy", "escalation_level", "start", "end")
+_ONCALL_DEFAULTS = {**dict.fromkeys(_ONCALL_KEYS), "escalation_level": 1}
+_get_oncall_fields = operator.itemgetter(*_ONCALL_KEYS)
 
 
 @click.command("oncall")
@@ -38,40 +48,28 @@ def oncall(
 
         rows = []
         for oc in oncalls:
-            user_info = oc.get("user", {})
-            schedule_info = oc.get("schedule", {})
-            policy_info = oc.get("escalation_policy", {})
-            level = oc.get("escalation_level", 1)
+            user_info, schedule_info, policy_info, level, start, end = _get_oncall_fields(
+                {**_ONCALL_DEFAULTS, **oc}
+            )
+            user_info = user_info or {}
+            policy_info = policy_info or {}
 
-            rows.append({
-                "user": user_info.get("summary", ""),
-                "email": user_info.get("email", ""),
-                "schedule": schedule_info.get("summary", "") if schedule_info else "Direct",
-                "policy": policy_info.get("summary", ""),
-                "level": level,
-                "start": _format_time(oc.get("start")),
-                "end": _format_time(oc.get("end")),
-            })
+            rows.append(OnCallRow(
+                user_info.get("summary", ""),
+                user_info.get("email", ""),
+                schedule_info.get("summary", "") if schedule_info else "Direct",
+                policy_info.get("summary", ""),
+                level,
+                format_timestamp(start),
+                format_timestamp(end),
+            ))
 
         ctx.output.print_table(
             rows,
-            columns=["user", "email", "schedule", "policy", "level", "start", "end"],
+            columns=list(OnCallRow._fields),
             title="On-Call",
         )
 
     except PagerDutyError as e:
         ctx.output.print_error(f"Failed to get on-call: {e}")
         raise click.Abort()
-
-
-def _format_time(timestamp: str | None) -> str:
-    """Format timestamp for display."""
-    if not timestamp:
-        return ""
-    try:
-        from datetime import datetime
-
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return timestamp
@@ -1,9 +1,14 @@
 """PagerDuty schedule commands."""
 
+from collections import namedtuple
+
 import click
 
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import PagerDutyError
+from devctl.core.utils import format_timestamp
+
+ScheduleRow = namedtuple("ScheduleRow", "id name time_zone users")
 
 
 @click.group()
@@ -30,18 +35,19 @@ def list_schedules(ctx: DevCtlContext, query: str | None) -> None:
             ctx.output.print_info("No schedules found")
             return
 
-        rows = []
-        for sched in schedules_list:
-            rows.append({
-                "id": sched.get("id", ""),
-                "name": sched.get("name", ""),
-                "time_zone": sched.get("time_zone", ""),
-                "users": len(sched.get("users", [])),
-            })
+        rows = [
+            ScheduleRow(
+                sched.get("id", ""),
+                sched.get("name", ""),
+                sched.get("time_zone", ""),
+                len(sched.get("users", [])),
+            )
+            for sched in schedules_list
+        ]
 
         ctx.output.print_table(
             rows,
-            columns=["id", "name", "time_zone", "users"],
+            columns=list(ScheduleRow._fields),
             title="Schedules",
         )
 
@@ -84,22 +90,9 @@ def show_schedule(ctx: DevCtlContext, schedule_id: str) -> None:
                 user = entry.get("user", {})
                 ctx.output.print(
                     f"  {user.get('summary', '')}: "
-                    f"{_format_time(entry.get('start'))} - {_format_time(entry.get('end'))}"
+                    f"{format_timestamp(entry.get('start'))} - {format_timestamp(entry.get('end'))}"
                 )
 
     except PagerDutyError as e:
         ctx.output.print_error(f"Failed to get schedule: {e}")
         raise click.Abort()
-
-
-def _format_time(timestamp: str | None) -> str:
-    """Format timestamp for display."""
-    if not timestamp:
-        return ""
-    try:
-        from datetime import datetime
-
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return timestamp
@@ -1,10 +1,14 @@
 """PagerDuty service commands."""
 
+from collections import namedtuple
+
 import click
 
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import PagerDutyError
 
+ServiceRow = namedtuple("ServiceRow", "id name status escalation_policy")
+
 
 @click.group()
 def services() -> None:
@@ -38,18 +42,19 @@ def list_services(
             ctx.output.print_info("No services found")
             return
 
-        rows = []
-        for svc in services_list:
-            rows.append({
-                "id": svc.get("id", ""),
-                "name": svc.get("name", ""),
-                "status": svc.get("status", ""),
-                "escalation_policy": svc.get("escalation_policy", {}).get("summary", ""),
-            })
+        rows = [
+            ServiceRow(
+                svc.get("id", ""),
+                svc.get("name", ""),
+                svc.get("status", ""),
+                svc.get("escalation_policy", {}).get("summary", ""),
+            )
+            for svc in services_list
+        ]
 
         ctx.output.print_table(
             rows,
-            columns=["id", "name", "status", "escalation_policy"],
+            columns=list(ServiceRow._fields),
             title="Services",
         )
 
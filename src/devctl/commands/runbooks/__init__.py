@@ -1,11 +1,41 @@
 """Runbook command group."""
 
-import click
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
 
+from devctl import __version__
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import RunbookError
-from devctl.runbooks import RunbookEngine
+from devctl.core.utils import get_cache_dir
+
+if TYPE_CHECKING:
+    from devctl.runbooks import RunbookEngine
+
+# Validation results cache, keyed by a digest of the runbook file
+VALIDATE_CACHE_FILE = "runbook-validate.json"
+VALIDATE_CACHE_MAX_ENTRIES = 256
+
+
+@lru_cache(maxsize=1)
+def _get_engine() -> "RunbookEngine":
+    """Get the shared runbook engine.
+
+    Commands that need prompt/output handlers bind them per call with
+    RunbookEngine.with_handlers(). The engine is imported here so other
+    devctl commands do not pay for loading it.
+    """
+    from devctl.runbooks import RunbookEngine
+
+    return RunbookEngine()
 
 
 @click.group()
@@ -23,7 +53,7 @@ def runbook(ctx: DevCtlContext) -> None:
 
 
 @runbook.command("run")
-@click.argument("file", type=click.Path(exists=True))
+@click.argument("file", type=click.Path(dir_okay=False))
 @click.option("--var", "-v", multiple=True, help="Variable (key=value)")
 @click.option("-y", "--yes", is_flag=True, help="Skip confirmations")
 @click.option("--start", default=None, help="Start from step ID")
@@ -47,8 +77,8 @@ def run(
         # Parse variables
         variables = {}
         for v in var:
-            if "=" in v:
-                key, value = v.split("=", 1)
+            key, sep, value = v.partition("=")
+            if sep:
                 variables[key] = value
 
         # Create engine with handlers
@@ -69,7 +99,7 @@ def run(
             if output and not ctx.quiet:
                 ctx.output.print(f"[{step_id}] {output}")
 
-        engine = RunbookEngine(
+        engine = _get_engine().with_handlers(
             prompt_handler=prompt_handler,
             output_handler=output_handler,
         )
@@ -115,8 +145,7 @@ def list_runbooks(ctx: DevCtlContext, directory: str, templates: bool) -> None:
         devctl runbook list -d ./runbooks
     """
     try:
-        engine = RunbookEngine()
-        runbooks = engine.list_runbooks(directory)
+        runbooks = _get_engine().list_runbooks(directory)
 
         if templates:
             runbooks = [r for r in runbooks if "template" in r.get("tags", [])]
@@ -125,16 +154,11 @@ def list_runbooks(ctx: DevCtlContext, directory: str, templates: bool) -> None:
             ctx.output.print_info("No runbooks found")
             return
 
-        rows = []
-        for rb in runbooks:
-            rows.append({
-                "name": rb.get("name", ""),
-                "version": rb.get("version", ""),
-                "steps": rb.get("steps", 0),
-                "file": Path(rb.get("file", "")).name,
-            })
-
-        ctx.output.print_table(rows, columns=["name", "version", "steps", "file"], title="Runbooks")
+        ctx.output.print_table(
+            (_runbook_row(rb) for rb in runbooks),
+            columns=["name", "version", "steps", "file"],
+            title="Runbooks",
+        )
 
     except Exception as e:
         ctx.output.print_error(f"Failed to list runbooks: {e}")
@@ -142,34 +166,47 @@ def list_runbooks(ctx: DevCtlContext, directory: str, templates: bool) -> None:
 
 
 @runbook.command("validate")
-@click.argument("file", type=click.Path(exists=True))
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True))
 @pass_context
-def validate(ctx: DevCtlContext, file: str) -> None:
-    """Validate a runbook.
+def validate(ctx: DevCtlContext, files: tuple[str, ...]) -> None:
+    """Validate one or more runbooks.
+
+    Runbooks not already in the validation cache are checked in parallel
+    worker processes when more than one needs validating.
 
     \b
     Examples:
         devctl runbook validate my-runbook.yaml
+        devctl runbook validate runbooks/*.yaml
     """
     try:
-        engine = RunbookEngine()
-        rb = engine.load(file)
-        issues = engine.validate(rb)
+        summaries = _validate_many([Path(f) for f in files])
+    except RunbookError as e:
+        ctx.output.print_error(f"Validation failed: {e}")
+        raise click.Abort()
 
-        ctx.output.print_header(f"Validating: {rb.name}")
-        ctx.output.print(f"Version: {rb.version}")
-        ctx.output.print(f"Steps: {len(rb.steps)}")
+    failed = False
+    for summary in summaries:
+        if "error" in summary:
+            ctx.output.print_error(f"Validation failed: {summary['error']}")
+            failed = True
+            continue
+
+        issues = summary["issues"]
+
+        ctx.output.print_header(f"Validating: {summary['name']}")
+        ctx.output.print(f"Version: {summary['version']}")
+        ctx.output.print(f"Steps: {summary['steps']}")
 
         if issues:
             ctx.output.print_error(f"\nFound {len(issues)} issue(s):")
             for issue in issues:
                 ctx.output.print(f"  - {issue}")
-            raise click.Abort()
+            failed = True
         else:
             ctx.output.print_success("\nRunbook is valid")
 
-    except RunbookError as e:
-        ctx.output.print_error(f"Validation failed: {e}")
+    if failed:
         raise click.Abort()
 
 
@@ -195,19 +232,145 @@ def history(ctx: DevCtlContext, limit: int, runbook_name: str | None) -> None:
             ctx.output.print_info("No history found")
             return
 
-        rows = []
-        for entry in entries:
-            rows.append({
-                "id": entry.get("audit_id", "")[:12],
-                "runbook": entry.get("runbook_name", ""),
-                "status": entry.get("status", ""),
-                "duration": f"{entry.get('duration_seconds', 0):.1f}s",
-                "user": entry.get("user", ""),
-                "time": entry.get("timestamp", "")[:19],
-            })
-
-        ctx.output.print_table(rows, columns=["id", "runbook", "status", "duration", "user", "time"], title="History")
+        ctx.output.print_table(
+            (_history_row(entry) for entry in entries),
+            columns=["id", "runbook", "status", "duration", "user", "time"],
+            title="History",
+        )
 
     except Exception as e:
         ctx.output.print_error(f"Failed to get history: {e}")
         raise click.Abort()
+
+
+def _runbook_row(rb: dict[str, Any]) -> dict[str, Any]:
+    """Build a runbook list table row."""
+    return {
+        "name": rb.get("name", ""),
+        "version": rb.get("version", ""),
+        "steps": rb.get("steps", 0),
+        "file": Path(rb.get("file", "")).name,
+    }
+
+
+def _history_row(entry: dict[str, Any]) -> dict[str, Any]:
+    """Build a runbook history table row."""
+    return {
+        "id": entry.get("audit_id", "")[:12],
+        "runbook": entry.get("runbook_name", ""),
+        "status": entry.get("status", ""),
+        "duration": f"{entry.get('duration_seconds', 0):.1f}s",
+        "user": entry.get("user", ""),
+        "time": entry.get("timestamp", "")[:19],
+    }
+
+
+def _validate_many(paths: list[Path]) -> list[dict[str, Any]]:
+    """Validate runbooks, reusing stored results for unchanged content.
+
+    Results are keyed by a BLAKE2b digest of the devctl version, file name
+    and file bytes, so an upgrade, an edit, or a rename (which can change
+    the default runbook name) invalidates the entry. Cache misses are
+    validated in a process pool when there is more than one; only this
+    process reads and writes the cache file.
+
+    Returns:
+        One summary dict per path, in order: the runbook name, version,
+        step count and issues, or an "error" message if it failed to load
+    """
+    digests = [_runbook_digest(path) for path in paths]
+    cache = _load_validate_cache()
+
+    misses = [(path, digest) for path, digest in zip(paths, digests, strict=True) if digest not in cache]
+    if len(misses) > 1:
+        workers = min(len(misses), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as pool:
+            results = list(pool.map(_validate_one, [str(path) for path, _ in misses]))
+    else:
+        results = [_validate_summary(_get_engine(), path) for path, _ in misses]
+
+    fresh = {digest: summary for (_, digest), summary in zip(misses, results, strict=True)}
+    if fresh:
+        cache.update({d: s for d, s in fresh.items() if "error" not in s})
+        _save_validate_cache(cache)
+
+    return [fresh.get(digest) or cache[digest] for digest in digests]
+
+
+def _runbook_digest(path: Path) -> str:
+    """Digest identifying a runbook's validation result."""
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        raise RunbookError(f"Runbook file not found: {path}")
+    except OSError as e:
+        raise RunbookError(f"Cannot read runbook {path}: {e.strerror}")
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(__version__.encode())
+    hasher.update(b"\0")
+    hasher.update(path.name.encode())
+    hasher.update(b"\0")
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+def _validate_summary(engine: "RunbookEngine", path: Path) -> dict[str, Any]:
+    """Load and validate a runbook into a summary dict.
+
+    Load failures (including YAML syntax errors) are reported in the
+    summary rather than raised, so one broken file does not stop a batch.
+    """
+    try:
+        rb = engine.load(path)
+    except Exception as e:
+        return {"error": f"{path}: {e}"}
+
+    return {
+        "name": rb.name,
+        "version": rb.version,
+        "steps": len(rb.steps),
+        "issues": engine.validate(rb),
+    }
+
+
+# Engine owned by each validation worker process
+_worker_engine: "RunbookEngine | None" = None
+
+
+def _worker_init() -> None:
+    """Build the runbook engine once per validation worker."""
+    global _worker_engine
+    from devctl.runbooks import RunbookEngine
+
+    _worker_engine = RunbookEngine()
+
+
+def _validate_one(path: str) -> dict[str, Any]:
+    """Validate a single runbook in a worker process."""
+    assert _worker_engine is not None
+    return _validate_summary(_worker_engine, Path(path))
+
+
+def _load_validate_cache() -> dict[str, Any]:
+    """Load stored validation results."""
+    try:
+        cache: dict[str, Any] = json.loads((get_cache_dir() / VALIDATE_CACHE_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache
+
+
+def _save_validate_cache(cache: dict[str, Any]) -> None:
+    """Store validation results, keeping only the most recent entries."""
+    data = json.dumps(dict(list(cache.items())[-VALIDATE_CACHE_MAX_ENTRIES:])).encode()
+    with contextlib.suppress(OSError):
+        cache_file = get_cache_dir() / VALIDATE_CACHE_FILE
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_file)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
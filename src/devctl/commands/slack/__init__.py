@@ -1,5 +1,7 @@
 """Slack command group."""
 
+from typing import Any
+
 import click
 
 from devctl.core.context import pass_context, DevCtlContext
@@ -133,23 +135,28 @@ def list_channels(ctx: DevCtlContext, include_archived: bool, limit: int) -> Non
             ctx.output.print_info("No channels found")
             return
 
-        rows = []
-        for ch in channels_list:
-            rows.append({
-                "id": ch.get("id", ""),
-                "name": ch.get("name", ""),
-                "members": ch.get("num_members", 0),
-                "private": "Yes" if ch.get("is_private") else "No",
-                "archived": "Yes" if ch.get("is_archived") else "No",
-            })
-
-        ctx.output.print_table(rows, columns=["id", "name", "members", "private", "archived"], title="Channels")
+        ctx.output.print_table(
+            (_channel_row(ch) for ch in channels_list),
+            columns=["id", "name", "members", "private", "archived"],
+            title="Channels",
+        )
 
     except SlackError as e:
         ctx.output.print_error(f"Failed to list channels: {e}")
         raise click.Abort()
 
 
+def _channel_row(ch: dict[str, Any]) -> dict[str, Any]:
+    """Build a channels table row."""
+    return {
+        "id": ch.get("id", ""),
+        "name": ch.get("name", ""),
+        "members": ch.get("num_members", 0),
+        "private": "Yes" if ch.get("is_private") else "No",
+        "archived": "Yes" if ch.get("is_archived") else "No",
+    }
+
+
 @channels.command("create")
 @click.argument("name")
 @click.option("--private", is_flag=True, help="Create private channel")
@@ -222,33 +229,34 @@ def list_users(ctx: DevCtlContext, limit: int) -> None:
         devctl slack users list
     """
     try:
-        result = ctx.slack.list_users(limit=limit)
-
-        members = result.get("members", [])
-        # Filter out bots and deleted users
-        members = [m for m in members if not m.get("is_bot") and not m.get("deleted")]
+        members = list(ctx.slack.iter_users(limit=limit, exclude_bots=True, exclude_deleted=True))
 
         if not members:
             ctx.output.print_info("No users found")
             return
 
-        rows = []
-        for user in members:
-            profile = user.get("profile", {})
-            rows.append({
-                "id": user.get("id", ""),
-                "name": user.get("name", ""),
-                "real_name": profile.get("real_name", ""),
-                "email": profile.get("email", ""),
-            })
-
-        ctx.output.print_table(rows, columns=["id", "name", "real_name", "email"], title="Users")
+        ctx.output.print_table(
+            (_user_row(user) for user in members),
+            columns=["id", "name", "real_name", "email"],
+            title="Users",
+        )
 
     except SlackError as e:
         ctx.output.print_error(f"Failed to list users: {e}")
         raise click.Abort()
 
 
+def _user_row(user: dict[str, Any]) -> dict[str, Any]:
+    """Build a users table row."""
+    profile = user.get("profile", {})
+    return {
+        "id": user.get("id", ""),
+        "name": user.get("name", ""),
+        "real_name": profile.get("real_name", ""),
+        "email": profile.get("email", ""),
+    }
+
+
 @slack.command("thread")
 @click.argument("channel")
 @click.argument("thread_ts")
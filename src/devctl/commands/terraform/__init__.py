@@ -1,18 +1,31 @@
 """Terraform command group."""
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import os
 import re
 import subprocess
 import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 import click
+import yaml
 
+from devctl.core.async_utils import gather_with_concurrency, run_sync
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import DevCtlError
+from devctl.core.utils import get_cache_dir, json_dumps_pretty, json_loads
 
 
 class TerraformError(DevCtlError):
@@ -20,8 +33,55 @@ class TerraformError(DevCtlError):
     pass
 
 
+# One `terraform workspace list` line: optional "*" current marker, then the name
+_WORKSPACE_LINE = re.compile(r"^\s*(\*?)\s*(\S+)\s*$", re.MULTILINE)
+
+# Longest output line accepted when streaming terraform via asyncio
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+# Temporary import-block file written by `terraform import-batch`
+IMPORT_BATCH_FILE = "_devctl_imports.tf"
+
+# Shared provider plugin cache used by `terraform init`
+PLUGIN_CACHE_SUBDIR = "tf-plugins"
+
+# An uncommented plugin_cache_dir setting in a terraform CLI config file
+_PLUGIN_CACHE_DIR_SETTING = re.compile(r"^\s*plugin_cache_dir\s*=", re.MULTILINE)
+
+# Opt-in pulled state cache for read-only state commands; the environment
+# variable holds how many seconds a pull is reused for (unset or 0: off)
+STATE_CACHE_SUBDIR = "tfstate"
+STATE_CACHE_TTL_ENV = "DEVCTL_TF_STATE_CACHE_TTL"
+
+# Known-formatted file cache for `terraform fmt`
+FMT_CACHE_FILE = "tf-fmt.json"
+FMT_CACHE_MAX_ENTRIES = 10000
+FMT_EXTENSIONS = (".tf", ".tfvars")
+
+# Fixed terraform argv prefixes
+_ARGS_INIT = ("init",)
+_ARGS_VALIDATE = ("validate", "-json")
+_ARGS_STATE_SHOW = ("state", "show")
+_ARGS_STATE_MV = ("state", "mv")
+_ARGS_STATE_RM = ("state", "rm")
+_ARGS_STATE_PULL = ("state", "pull")
+_ARGS_STATE_PUSH = ("state", "push")
+_ARGS_WORKSPACE_LIST = ("workspace", "list")
+_ARGS_WORKSPACE_SELECT = ("workspace", "select")
+_ARGS_WORKSPACE_NEW = ("workspace", "new")
+_ARGS_WORKSPACE_DELETE = ("workspace", "delete")
+_ARGS_OUTPUT = ("output",)
+_ARGS_PROVIDERS = ("providers",)
+_ARGS_GRAPH = ("graph",)
+
+
+@lru_cache(maxsize=1)
 def _check_terraform() -> str:
-    """Check if terraform is installed and return path."""
+    """Check if terraform is installed and return path.
+
+    The PATH lookup is done once per process. A failed lookup raises and
+    is therefore not cached.
+    """
     tf_path = shutil.which("terraform")
     if not tf_path:
         raise TerraformError(
@@ -31,30 +91,69 @@ def _check_terraform() -> str:
 
 
 def _run_terraform(
-    args: list[str],
+    args: Sequence[str],
     cwd: str | None = None,
     capture: bool = True,
     env: dict[str, str] | None = None,
+    line_callback: Callable[[str], None] | None = None,
+    stdout_file: str | None = None,
+    binary: bool = False,
 ) -> subprocess.CompletedProcess:
-    """Run a terraform command."""
+    """Run a terraform command.
+
+    With line_callback, combined stdout/stderr is streamed to the callback
+    line by line as terraform produces it, instead of being buffered
+    (capture=True) or written straight to the terminal (capture=False).
+
+    With stdout_file, terraform writes its stdout directly to that file
+    and only stderr is captured, so large output never passes through
+    this process.
+
+    With binary=True, captured stdout and stderr are returned as bytes,
+    which avoids decoding output that is only passed through or handed to
+    a bytes-accepting parser.
+
+    Terraform is started without a shell, preexec_fn, or user/group
+    changes, which lets CPython launch it with vfork (or posix_spawn)
+    rather than a full fork of this process. Keep it that way when adding
+    options here.
+    """
     tf_path = _check_terraform()
 
-    cmd = [tf_path] + args
+    cmd = [tf_path, *args]
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    # Only build a new environment when something changes; otherwise the
+    # child inherits ours directly.
+    run_env: dict[str, str] | None = None
+    if env or capture:
+        run_env = os.environ.copy()
+        if env:
+            run_env.update(env)
 
-    # Disable color if capturing output
-    if capture:
-        run_env["TF_CLI_ARGS"] = "-no-color"
+        # Disable color if capturing output
+        if capture:
+            run_env["TF_CLI_ARGS"] = "-no-color"
 
     try:
+        if line_callback is not None:
+            return _stream_terraform(cmd, cwd, run_env, line_callback)
+
+        if stdout_file is not None:
+            with open(stdout_file, "wb") as out:
+                return subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    stdout=out,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    env=run_env,
+                )
+
         result = subprocess.run(
             cmd,
             cwd=cwd,
             capture_output=capture,
-            text=True,
+            text=not binary,
             env=run_env,
         )
         return result
@@ -62,12 +161,326 @@ def _run_terraform(
         raise TerraformError(f"Failed to run terraform: {e}")
 
 
+def _stream_terraform(
+    cmd: list[str],
+    cwd: str | None,
+    env: dict[str, str] | None,
+    line_callback: Callable[[str], None],
+) -> subprocess.CompletedProcess[str]:
+    """Run terraform and pass each output line to line_callback."""
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            line_callback(line)
+
+    return subprocess.CompletedProcess(cmd, proc.returncode)
+
+
+def _prompt_safe_callback(ctx: DevCtlContext) -> Callable[[str], None] | None:
+    """Line callback for a terraform run that may prompt for input.
+
+    Terraform's prompts (such as "Enter a value: ") end without a newline,
+    so line streaming would hide them. With a terminal on stdin the output
+    is left on the terminal instead; otherwise it is streamed.
+    """
+    return None if sys.stdin.isatty() else ctx.output.print_ansi
+
+
+def _warm_terraform(cwd: str | None) -> None:
+    """Start a throwaway terraform run in the background.
+
+    Called before an interactive prompt so the terraform binary is located
+    and paged in while the user reads it, rather than after they answer.
+    """
+    def warm() -> None:
+        with contextlib.suppress(TerraformError):  # reported by the real run
+            _run_terraform(("version",), cwd=cwd, env={"CHECKPOINT_DISABLE": "1"})
+
+    threading.Thread(target=warm, daemon=True).start()
+
+
+async def _run_terraform_async(
+    args: list[str],
+    cwd: str,
+    line_callback: Callable[[str], None],
+) -> int:
+    """Run terraform as an asyncio subprocess, streaming output lines.
+
+    Returns:
+        Terraform exit code
+    """
+    tf_path = _check_terraform()
+    proc = await asyncio.create_subprocess_exec(
+        tf_path,
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=_STREAM_LINE_LIMIT,
+    )
+    assert proc.stdout is not None
+    async for line in proc.stdout:
+        line_callback(line.decode(errors="replace"))
+    return await proc.wait()
+
+
+async def _run_terraform_dirs(
+    args: list[str],
+    dirs: tuple[str, ...],
+    concurrency: int,
+    line_callback: Callable[[str, str], None],
+) -> list[int]:
+    """Run the same terraform command in several directories concurrently.
+
+    Output lines are passed to line_callback(dir, line) as they arrive.
+
+    Returns:
+        Exit codes in the same order as dirs
+    """
+    def for_dir(d: str) -> Callable[[str], None]:
+        return lambda line: line_callback(d, line)
+
+    return await gather_with_concurrency(
+        concurrency,
+        *[_run_terraform_async(args, d, for_dir(d)) for d in dirs],
+    )
+
+
+def _build_tf_args(
+    command: str,
+    variables: tuple[str, ...] = (),
+    var_file: str | None = None,
+    targets: tuple[str, ...] = (),
+    options: dict[str, Any] | None = None,
+    positional: tuple[str, ...] = (),
+) -> list[str]:
+    """Assemble terraform arguments in a single pass.
+
+    Args:
+        command: Terraform subcommand (plan, apply, destroy)
+        variables: --var key=value options
+        var_file: Variable file
+        targets: Resource addresses for -target
+        options: Flag to value; True adds a bare flag, falsy values are
+            skipped, anything else adds the flag and its value
+        positional: Trailing arguments, placed after all flags
+
+    Returns:
+        Argument list for _run_terraform
+    """
+    return list(chain(
+        (command,),
+        _var_args(variables),
+        ("-var-file", var_file) if var_file else (),
+        chain.from_iterable(("-target", t) for t in targets),
+        chain.from_iterable(
+            (flag,) if value is True else (flag, str(value))
+            for flag, value in (options or {}).items()
+            if value
+        ),
+        positional,
+    ))
+
+
+def _var_args(variables: tuple[str, ...]) -> list[str]:
+    """Build -var arguments from --var key=value options.
+
+    Variables are parsed once; a repeated key keeps its last value, as
+    terraform itself would, so only one -var pair per key is passed.
+    Variables stay on the command line rather than moving to TF_VAR_*
+    environment variables, which terraform ranks below terraform.tfvars
+    and -var-file.
+    """
+    parsed: dict[str, str] = {}
+    for var in variables:
+        key, sep, value = var.partition("=")
+        if not sep or not key:
+            raise click.BadParameter(f"Expected key=value, got: {var}", param_hint="--var")
+        parsed[key] = value
+
+    args: list[str] = []
+    for key, value in parsed.items():
+        args.extend(["-var", f"{key}={value}"])
+    return args
+
+
 def _get_workspace(cwd: str | None = None) -> str:
-    """Get current terraform workspace."""
-    result = _run_terraform(["workspace", "show"], cwd=cwd)
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return "default"
+    """Get current terraform workspace.
+
+    Reads the file terraform itself keeps the selected workspace in
+    (<data dir>/environment) instead of running `terraform workspace show`,
+    honoring TF_WORKSPACE and TF_DATA_DIR the same way terraform does.
+    """
+    workspace = os.environ.get("TF_WORKSPACE")
+    if workspace:
+        return workspace
+
+    env_file = _data_dir(cwd) / "environment"
+    try:
+        return env_file.read_text().strip() or "default"
+    except OSError:
+        return "default"
+
+
+def _plugin_cache_env() -> dict[str, str] | None:
+    """Environment enabling devctl's shared provider plugin cache.
+
+    Returns None when the user already set TF_PLUGIN_CACHE_DIR or a
+    plugin_cache_dir in their terraform CLI config, which take precedence.
+    """
+    if os.environ.get("TF_PLUGIN_CACHE_DIR"):
+        return None
+
+    cli_config = os.environ.get("TF_CLI_CONFIG_FILE") or os.path.expanduser("~/.terraformrc")
+    try:
+        if _PLUGIN_CACHE_DIR_SETTING.search(Path(cli_config).read_text()):
+            return None
+    except OSError:
+        pass
+
+    # Terraform does not create the cache directory itself
+    cache_dir = get_cache_dir() / PLUGIN_CACHE_SUBDIR
+    cache_dir.mkdir(exist_ok=True)
+    return {"TF_PLUGIN_CACHE_DIR": str(cache_dir)}
+
+
+def _data_dir(cwd: str | None = None) -> Path:
+    """Terraform's per-directory data dir (.terraform or TF_DATA_DIR)."""
+    return Path(cwd or ".") / os.environ.get("TF_DATA_DIR", ".terraform")
+
+
+def _state_cache_file(cwd: str | None) -> Path:
+    """Cache file for the pulled state of a directory's current workspace.
+
+    Keyed by the directory, workspace and backend configuration (the
+    backend file terraform writes on init), so re-initializing against a
+    different backend never serves stale state.
+    """
+    try:
+        backend = (_data_dir(cwd) / "terraform.tfstate").read_bytes()
+    except OSError:
+        backend = b""
+
+    hasher = hashlib.sha256()
+    hasher.update(os.path.abspath(cwd or ".").encode())
+    hasher.update(b"\0")
+    hasher.update(_get_workspace(cwd).encode())
+    hasher.update(b"\0")
+    hasher.update(backend)
+    return get_cache_dir() / STATE_CACHE_SUBDIR / f"{hasher.hexdigest()}.json"
+
+
+def _state_cache_ttl() -> float:
+    """Seconds a pulled state may be reused for; 0 when the cache is off."""
+    try:
+        return max(float(os.environ.get(STATE_CACHE_TTL_ENV, "0")), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _cached_state_pull(cwd: str | None, use_cache: bool = True) -> dict[str, Any]:
+    """Get the current state, reusing a recent pull if the cache is enabled.
+
+    Pulling state downloads it from the backend on every call. When
+    DEVCTL_TF_STATE_CACHE_TTL is set, the raw JSON is kept for that many
+    seconds so consecutive read-only commands (state list, output --json)
+    skip both the download and the terraform process. The state may hold
+    secrets, so the cache is off by default and expired entries are deleted.
+
+    Args:
+        cwd: Terraform directory
+        use_cache: False to always pull (the result is still cached)
+
+    Returns:
+        Parsed state (terraform state format v4)
+    """
+    ttl = _state_cache_ttl()
+    if not ttl:
+        raw_state = _pull_state_bytes(cwd)
+        return json_loads(raw_state) if raw_state.strip() else {}
+
+    cache_file = _state_cache_file(cwd)
+    _expire_state_cache(cache_file.parent, ttl)
+
+    if use_cache:
+        try:
+            cached: dict[str, Any] = json_loads(cache_file.read_bytes())
+            return cached
+        except (OSError, ValueError):
+            pass
+
+    raw_state = _pull_state_bytes(cwd)
+    _store_state_cache(cache_file, raw_state)
+    return json_loads(raw_state) if raw_state.strip() else {}
+
+
+def _pull_state_bytes(cwd: str | None) -> bytes:
+    """Run `terraform state pull`, returning the raw (undecoded) state."""
+    result = _run_terraform(_ARGS_STATE_PULL, cwd=cwd, binary=True)
+    if result.returncode != 0:
+        raise TerraformError(f"Pull failed: {result.stderr.decode(errors='replace')}")
+    raw_state: bytes = result.stdout
+    return raw_state
+
+
+def _store_state_cache(cache_file: Path, raw_state: bytes) -> None:
+    """Write pulled state to the cache, readable only by the user."""
+    with contextlib.suppress(OSError):
+        cache_file.parent.mkdir(mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw_state)
+            os.replace(tmp, cache_file)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _expire_state_cache(cache_dir: Path, ttl: float) -> None:
+    """Delete cached states (and stray temp files) older than ttl seconds."""
+    cutoff = time.time() - ttl
+    with contextlib.suppress(OSError), os.scandir(cache_dir) as it:
+        for entry in it:
+            with contextlib.suppress(OSError):
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+
+
+def _invalidate_state_cache(cwd: str | None) -> None:
+    """Drop the cached state after a command that may have changed it."""
+    _state_cache_file(cwd).unlink(missing_ok=True)
+
+
+def _state_addresses(state: dict[str, Any]) -> Iterator[str]:
+    """Yield resource instance addresses from raw state, like `state list`."""
+    for resource in state.get("resources", []):
+        prefix = f"{resource['module']}." if resource.get("module") else ""
+        if resource.get("mode") == "data":
+            prefix += "data."
+        base = f"{prefix}{resource['type']}.{resource['name']}"
+
+        for instance in resource.get("instances", []):
+            key = instance.get("index_key")
+            if key is None:
+                yield base
+            elif isinstance(key, int):
+                yield f"{base}[{key}]"
+            else:
+                yield f"{base}[{json.dumps(key)}]"
+
+
+def _address_matches(address: str, pattern: str) -> bool:
+    """Whether address is pattern itself or lies within it."""
+    return address == pattern or address.startswith((f"{pattern}.", f"{pattern}["))
 
 
 @click.group()
@@ -89,64 +502,106 @@ def terraform(ctx: DevCtlContext) -> None:
 
 
 @terraform.command()
-@click.option("--dir", "-d", "working_dir", type=click.Path(exists=True), help="Terraform directory")
+@click.option(
+    "--dir",
+    "-d",
+    "working_dirs",
+    type=click.Path(exists=True),
+    multiple=True,
+    help="Terraform directory (repeat to plan several in parallel)",
+)
 @click.option("--var", "-v", "variables", multiple=True, help="Variables (key=value)")
 @click.option("--var-file", type=click.Path(exists=True), help="Variable file")
 @click.option("--target", "-t", multiple=True, help="Target specific resources")
 @click.option("--out", "plan_file", help="Save plan to file")
 @click.option("--destroy", is_flag=True, help="Create a destroy plan")
 @click.option("--refresh-only", is_flag=True, help="Only update state, don't plan changes")
+@click.option("--max-parallel", type=click.IntRange(min=1), default=4, help="Directories planned at once")
 @pass_context
 def plan(
     ctx: DevCtlContext,
-    working_dir: str | None,
+    working_dirs: tuple[str, ...],
     variables: tuple[str, ...],
     var_file: str | None,
     target: tuple[str, ...],
     plan_file: str | None,
     destroy: bool,
     refresh_only: bool,
+    max_parallel: int,
 ) -> None:
     """Run terraform plan.
 
+    With several --dir options the plans run concurrently (up to
+    --max-parallel at a time) and each output line is prefixed with its
+    directory.
+
     \b
     Examples:
         devctl terraform plan
         devctl terraform plan --var environment=staging
         devctl terraform plan --target aws_instance.web
         devctl terraform plan --out tfplan
+        devctl terraform plan -d network -d compute -d data
     """
-    args = ["plan"]
+    args = _build_tf_args(
+        "plan",
+        variables,
+        var_file,
+        target,
+        {"-out": plan_file, "-destroy": destroy, "-refresh-only": refresh_only},
+    )
 
-    for var in variables:
-        args.extend(["-var", var])
+    if len(working_dirs) > 1:
+        _plan_dirs(ctx, args, working_dirs, max_parallel)
+        return
 
-    if var_file:
-        args.extend(["-var-file", var_file])
+    working_dir = working_dirs[0] if working_dirs else None
+    workspace = _get_workspace(working_dir)
+    ctx.output.print_info(f"Running terraform plan (workspace: {workspace})")
 
-    for t in target:
-        args.extend(["-target", t])
+    if ctx.dry_run:
+        ctx.output.print_info(f"Would run: terraform {' '.join(args)}")
+        return
 
-    if plan_file:
-        args.extend(["-out", plan_file])
+    result = _run_terraform(
+        args, cwd=working_dir, capture=False, line_callback=_prompt_safe_callback(ctx)
+    )
 
-    if destroy:
-        args.append("-destroy")
+    if result.returncode != 0:
+        raise TerraformError("Terraform plan failed")
 
-    if refresh_only:
-        args.append("-refresh-only")
 
-    workspace = _get_workspace(working_dir)
-    ctx.output.print_info(f"Running terraform plan (workspace: {workspace})")
+def _plan_dirs(
+    ctx: DevCtlContext,
+    args: list[str],
+    working_dirs: tuple[str, ...],
+    max_parallel: int,
+) -> None:
+    """Run terraform plan in several directories concurrently.
+
+    The plans share one terminal and their output is piped, so they run
+    with -input=false: a directory missing a variable fails instead of
+    waiting on a hidden prompt.
+    """
+    args = [args[0], "-input=false", *args[1:]]
+
+    for d in working_dirs:
+        ctx.output.print_info(f"Running terraform plan in {d} (workspace: {_get_workspace(d)})")
 
     if ctx.dry_run:
         ctx.output.print_info(f"Would run: terraform {' '.join(args)}")
         return
 
-    result = _run_terraform(args, cwd=working_dir, capture=False)
+    def print_line(d: str, line: str) -> None:
+        ctx.output.print_ansi(f"[{d}] {line}")
 
-    if result.returncode != 0:
-        raise TerraformError("Terraform plan failed")
+    codes = run_sync(_run_terraform_dirs(args, working_dirs, max_parallel, print_line))
+
+    failed = [d for d, code in zip(working_dirs, codes, strict=True) if code != 0]
+    if failed:
+        raise TerraformError(f"Terraform plan failed in: {', '.join(failed)}")
+
+    ctx.output.print_success(f"Planned {len(working_dirs)} directories")
 
 
 @terraform.command()
@@ -176,24 +631,12 @@ def apply(
         devctl terraform apply --var environment=production
         devctl terraform apply --plan-file tfplan
     """
-    args = ["apply"]
-
+    options = {"-auto-approve": auto_approve, "-parallelism": parallelism}
     if plan_file:
-        args.append(plan_file)
+        # Variables and targets are baked into a saved plan
+        args = _build_tf_args("apply", options=options, positional=(plan_file,))
     else:
-        for var in variables:
-            args.extend(["-var", var])
-
-        if var_file:
-            args.extend(["-var-file", var_file])
-
-        for t in target:
-            args.extend(["-target", t])
-
-    if auto_approve:
-        args.append("-auto-approve")
-
-    args.extend(["-parallelism", str(parallelism)])
+        args = _build_tf_args("apply", variables, var_file, target, options)
 
     workspace = _get_workspace(working_dir)
     ctx.output.print_info(f"Running terraform apply (workspace: {workspace})")
@@ -202,7 +645,16 @@ def apply(
         ctx.output.print_info(f"Would run: terraform {' '.join(args)}")
         return
 
-    result = _run_terraform(args, cwd=working_dir, capture=False)
+    # Interactive approval needs terraform's prompt on the terminal as-is;
+    # non-interactive applies are streamed through devctl's output.
+    streaming = auto_approve or plan_file is not None
+    result = _run_terraform(
+        args,
+        cwd=working_dir,
+        capture=False,
+        line_callback=ctx.output.print_ansi if streaming else None,
+    )
+    _invalidate_state_cache(working_dir)
 
     if result.returncode != 0:
         raise TerraformError("Terraform apply failed")
@@ -232,19 +684,7 @@ def destroy(
         devctl terraform destroy --auto-approve
         devctl terraform destroy --target aws_instance.web
     """
-    args = ["destroy"]
-
-    for var in variables:
-        args.extend(["-var", var])
-
-    if var_file:
-        args.extend(["-var-file", var_file])
-
-    for t in target:
-        args.extend(["-target", t])
-
-    if auto_approve:
-        args.append("-auto-approve")
+    args = _build_tf_args("destroy", variables, var_file, target, {"-auto-approve": auto_approve})
 
     workspace = _get_workspace(working_dir)
     ctx.output.print_warning(f"Running terraform destroy (workspace: {workspace})")
@@ -254,6 +694,7 @@ def destroy(
         return
 
     result = _run_terraform(args, cwd=working_dir, capture=False)
+    _invalidate_state_cache(working_dir)
 
     if result.returncode != 0:
         raise TerraformError("Terraform destroy failed")
@@ -267,12 +708,16 @@ def destroy(
 def init(ctx: DevCtlContext, working_dir: str | None) -> None:
     """Run terraform init.
 
+    Providers are installed through a shared plugin cache (under the
+    devctl cache directory) unless one is already configured, so each
+    provider version is downloaded once rather than per directory.
+
     \b
     Examples:
         devctl terraform init
         devctl terraform init --dir ./infra
     """
-    args = ["init"]
+    args = _ARGS_INIT
 
     ctx.output.print_info("Initializing terraform...")
 
@@ -280,7 +725,7 @@ def init(ctx: DevCtlContext, working_dir: str | None) -> None:
         ctx.output.print_info("Would run: terraform init")
         return
 
-    result = _run_terraform(args, cwd=working_dir, capture=False)
+    result = _run_terraform(args, cwd=working_dir, capture=False, env=_plugin_cache_env())
 
     if result.returncode != 0:
         raise TerraformError("Terraform init failed")
@@ -298,14 +743,14 @@ def validate(ctx: DevCtlContext, working_dir: str | None) -> None:
     Examples:
         devctl terraform validate
     """
-    args = ["validate", "-json"]
+    args = _ARGS_VALIDATE
 
     result = _run_terraform(args, cwd=working_dir)
 
     if result.returncode != 0:
         ctx.output.print_error("Validation failed")
         try:
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             for diag in data.get("diagnostics", []):
                 severity = diag.get("severity", "error")
                 summary = diag.get("summary", "Unknown error")
@@ -313,7 +758,7 @@ def validate(ctx: DevCtlContext, working_dir: str | None) -> None:
                 ctx.output.print(f"[{'red' if severity == 'error' else 'yellow'}]{severity}:[/] {summary}")
                 if detail:
                     ctx.output.print(f"  {detail}")
-        except json.JSONDecodeError:
+        except ValueError:
             ctx.output.print(result.stdout)
         raise TerraformError("Validation failed")
 
@@ -326,28 +771,120 @@ def validate(ctx: DevCtlContext, working_dir: str | None) -> None:
 def fmt(ctx: DevCtlContext, working_dir: str | None) -> None:
     """Format terraform files.
 
+    Files unchanged (same mtime and size) since they were last found
+    formatted are skipped; terraform only runs for directories that
+    contain new or modified files.
+
     \b
     Examples:
         devctl terraform fmt
     """
-    args = ["fmt", "-recursive"]
+    root = os.path.abspath(working_dir or ".")
+    files = _tf_files(root)
+    formatter = _fmt_formatter_id()
+    known = _load_fmt_cache(formatter)
+
+    dirty_dirs = sorted({
+        os.path.dirname(path)
+        for path, signature in files.items()
+        if known.get(path) != signature
+    })
+
+    output: list[str] = []
+    failed = False
+    for directory in dirty_dirs:
+        args = ["fmt"]
+        if ctx.dry_run:
+            args.append("-check")
+        args.append(os.path.relpath(directory, root))
+
+        result = _run_terraform(args, cwd=root)
+        if result.stdout:
+            output.append(result.stdout.rstrip())
 
-    if ctx.dry_run:
-        args.append("-check")
+        if result.returncode != 0:
+            failed = True
+            continue
 
-    result = _run_terraform(args, cwd=working_dir)
+        # Everything in this directory is now known to be formatted
+        for path in files:
+            if os.path.dirname(path) == directory:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                known[path] = [st.st_mtime_ns, st.st_size]
+
+    if dirty_dirs:
+        _save_fmt_cache(formatter, known)
 
     if ctx.dry_run:
-        if result.returncode != 0:
+        if failed:
             ctx.output.print_warning("Files need formatting")
-            if result.stdout:
-                ctx.output.print(result.stdout)
+            if output:
+                ctx.output.print("\n".join(output))
         else:
             ctx.output.print_success("All files formatted correctly")
     else:
         ctx.output.print_success("Terraform files formatted")
-        if result.stdout:
-            ctx.output.print(result.stdout)
+        if output:
+            ctx.output.print("\n".join(output))
+
+
+def _tf_files(root: str) -> dict[str, list[int]]:
+    """Find terraform files under root, like `terraform fmt -recursive`.
+
+    Hidden directories (.terraform, .git) are skipped.
+
+    Returns:
+        Mapping of absolute path to [mtime_ns, size]
+    """
+    files: dict[str, list[int]] = {}
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(FMT_EXTENSIONS) and entry.is_file():
+                    st = entry.stat()
+                    files[entry.path] = [st.st_mtime_ns, st.st_size]
+    return files
+
+
+def _fmt_formatter_id() -> str:
+    """Identify the terraform binary, so an upgrade invalidates the fmt cache."""
+    tf_path = _check_terraform()
+    return f"{tf_path}:{os.stat(tf_path).st_mtime_ns}"
+
+
+def _load_fmt_cache(formatter: str) -> dict[str, list[int]]:
+    """Load known-formatted file signatures for this terraform binary."""
+    try:
+        cache = json_loads((get_cache_dir() / FMT_CACHE_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("formatter") != formatter:
+        return {}
+    files: dict[str, list[int]] = cache.get("files", {})
+    return files
+
+
+def _save_fmt_cache(formatter: str, files: dict[str, list[int]]) -> None:
+    """Store known-formatted file signatures, keeping the newest entries."""
+    entries = list(files.items())[-FMT_CACHE_MAX_ENTRIES:]
+    data = json.dumps({"formatter": formatter, "files": dict(entries)}).encode()
+    with contextlib.suppress(OSError):
+        cache_file = get_cache_dir() / FMT_CACHE_FILE
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_file)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
 
 
 # ============================================================================
@@ -372,36 +909,27 @@ def state(ctx: DevCtlContext) -> None:
 @state.command("list")
 @click.option("--dir", "-d", "working_dir", type=click.Path(exists=True), help="Terraform directory")
 @click.option("--filter", "filter_pattern", help="Filter resources by pattern")
+@click.option("--no-cache", is_flag=True, help="Pull fresh state instead of a recent cached copy")
 @pass_context
-def state_list(ctx: DevCtlContext, working_dir: str | None, filter_pattern: str | None) -> None:
+def state_list(
+    ctx: DevCtlContext,
+    working_dir: str | None,
+    filter_pattern: str | None,
+    no_cache: bool,
+) -> None:
     """List resources in state."""
-    args = ["state", "list"]
-
-    if filter_pattern:
-        args.append(filter_pattern)
-
-    result = _run_terraform(args, cwd=working_dir)
-
-    if result.returncode != 0:
-        raise TerraformError(f"Failed to list state: {result.stderr}")
+    state_data = _cached_state_pull(working_dir, use_cache=not no_cache)
 
-    resources = [r for r in result.stdout.strip().split("\n") if r]
+    data = [
+        {"Address": address, "Type": address.partition(".")[0]}
+        for address in _state_addresses(state_data)
+        if not filter_pattern or _address_matches(address, filter_pattern)
+    ]
 
-    if not resources:
+    if not data:
         ctx.output.print_info("No resources in state")
         return
 
-    data = []
-    for resource in resources:
-        # Parse resource type from address
-        parts = resource.split(".")
-        resource_type = parts[0] if parts else "unknown"
-
-        data.append({
-            "Address": resource,
-            "Type": resource_type,
-        })
-
     ctx.output.print_data(
         data,
         headers=["Address", "Type"],
@@ -415,7 +943,7 @@ def state_list(ctx: DevCtlContext, working_dir: str | None, filter_pattern: str
 @pass_context
 def state_show(ctx: DevCtlContext, address: str, working_dir: str | None) -> None:
     """Show resource details from state."""
-    args = ["state", "show", address]
+    args = [*_ARGS_STATE_SHOW, address]
 
     result = _run_terraform(args, cwd=working_dir)
 
@@ -426,26 +954,102 @@ def state_show(ctx: DevCtlContext, address: str, working_dir: str | None) -> Non
 
 
 @state.command("mv")
-@click.argument("source")
-@click.argument("destination")
+@click.argument("addresses", nargs=-1)
+@click.option(
+    "--from-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML list of moves ({from: ..., to: ...})",
+)
 @click.option("--dir", "-d", "working_dir", type=click.Path(exists=True), help="Terraform directory")
 @pass_context
-def state_mv(ctx: DevCtlContext, source: str, destination: str, working_dir: str | None) -> None:
-    """Move resource in state."""
-    args = ["state", "mv", source, destination]
+def state_mv(
+    ctx: DevCtlContext,
+    addresses: tuple[str, ...],
+    from_file: str | None,
+    working_dir: str | None,
+) -> None:
+    """Move resources in state.
+
+    ADDRESSES are SOURCE DESTINATION pairs. Several moves (extra pairs or
+    --from-file) are applied to a single pulled copy of the state, which
+    is pushed back once: the backend is read and written one time, and a
+    failed move leaves it untouched.
+
+    \b
+    Examples:
+        devctl terraform state mv aws_instance.old aws_instance.new
+        devctl terraform state mv module.a.aws_s3_bucket.x module.b.aws_s3_bucket.x aws_iam_role.r aws_iam_role.app
+        devctl terraform state mv --from-file moves.yaml
+    """
+    moves = _parse_moves(addresses, from_file)
 
-    ctx.output.print_info(f"Moving {source} -> {destination}")
+    for source, destination in moves:
+        ctx.output.print_info(f"Moving {source} -> {destination}")
 
     if ctx.dry_run:
         ctx.output.print_info("Would run: terraform state mv")
         return
 
-    result = _run_terraform(args, cwd=working_dir)
+    try:
+        if len(moves) == 1:
+            source, destination = moves[0]
+            result = _run_terraform([*_ARGS_STATE_MV, source, destination], cwd=working_dir)
+            if result.returncode != 0:
+                raise TerraformError(f"Move failed: {result.stderr}")
+        else:
+            _state_mv_batch(moves, working_dir)
+    finally:
+        _invalidate_state_cache(working_dir)
+
+    for source, destination in moves:
+        ctx.output.print_success(f"Moved {source} to {destination}")
 
-    if result.returncode != 0:
-        raise TerraformError(f"Move failed: {result.stderr}")
 
-    ctx.output.print_success(f"Moved {source} to {destination}")
+def _parse_moves(addresses: tuple[str, ...], from_file: str | None) -> list[tuple[str, str]]:
+    """Collect (source, destination) pairs from arguments and a moves file."""
+    if len(addresses) % 2:
+        raise click.BadParameter("Expected SOURCE DESTINATION pairs", param_hint="ADDRESSES")
+
+    moves = list(zip(addresses[::2], addresses[1::2], strict=True))
+
+    if from_file:
+        with open(from_file) as f:
+            entries = yaml.safe_load(f) or []
+        if not isinstance(entries, list):
+            raise click.BadParameter("Expected a list of moves", param_hint="--from-file")
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get("from") or not entry.get("to"):
+                raise click.BadParameter(f"Invalid move: {entry}", param_hint="--from-file")
+            moves.append((str(entry["from"]), str(entry["to"])))
+
+    if not moves:
+        raise click.UsageError("Nothing to move: give SOURCE DESTINATION or --from-file")
+
+    return moves
+
+
+def _state_mv_batch(moves: list[tuple[str, str]], working_dir: str | None) -> None:
+    """Apply several state moves with one state pull and one push."""
+    with tempfile.TemporaryDirectory(prefix="devctl-tfstate-") as tmp:
+        state_file = os.path.join(tmp, "terraform.tfstate")
+
+        result = _run_terraform(_ARGS_STATE_PULL, cwd=working_dir, stdout_file=state_file)
+        if result.returncode != 0:
+            raise TerraformError(f"Pull failed: {result.stderr}")
+
+        for source, destination in moves:
+            result = _run_terraform(
+                [*_ARGS_STATE_MV, f"-state={state_file}", source, destination],
+                cwd=working_dir,
+            )
+            if result.returncode != 0:
+                raise TerraformError(
+                    f"Move {source} -> {destination} failed (state not changed): {result.stderr}"
+                )
+
+        result = _run_terraform([*_ARGS_STATE_PUSH, state_file], cwd=working_dir)
+        if result.returncode != 0:
+            raise TerraformError(f"Push failed: {result.stderr}")
 
 
 @state.command("rm")
@@ -456,18 +1060,21 @@ def state_mv(ctx: DevCtlContext, source: str, destination: str, working_dir: str
 def state_rm(ctx: DevCtlContext, address: str, working_dir: str | None, force: bool) -> None:
     """Remove resource from state (does not destroy)."""
     if not force:
+        if not ctx.dry_run:
+            _warm_terraform(working_dir)
         ctx.output.print_warning(f"About to remove {address} from state (resource will NOT be destroyed)")
         if not click.confirm("Continue?"):
             ctx.output.print_info("Cancelled")
             return
 
-    args = ["state", "rm", address]
+    args = [*_ARGS_STATE_RM, address]
 
     if ctx.dry_run:
         ctx.output.print_info("Would run: terraform state rm")
         return
 
     result = _run_terraform(args, cwd=working_dir)
+    _invalidate_state_cache(working_dir)
 
     if result.returncode != 0:
         raise TerraformError(f"Remove failed: {result.stderr}")
@@ -480,19 +1087,33 @@ def state_rm(ctx: DevCtlContext, address: str, working_dir: str | None, force: b
 @click.option("--out", "output_file", type=click.Path(), help="Output file")
 @pass_context
 def state_pull(ctx: DevCtlContext, working_dir: str | None, output_file: str | None) -> None:
-    """Pull current state."""
-    args = ["state", "pull"]
-
-    result = _run_terraform(args, cwd=working_dir)
-
-    if result.returncode != 0:
-        raise TerraformError(f"Pull failed: {result.stderr}")
+    """Pull current state.
 
+    Always pulls from the backend. With --out, terraform writes the state
+    straight to the file, which is only replaced once the pull succeeds.
+    """
     if output_file:
-        Path(output_file).write_text(result.stdout)
+        _state_pull_to_file(working_dir, output_file)
         ctx.output.print_success(f"State saved to {output_file}")
-    else:
-        ctx.output.print_code(result.stdout, "json")
+        return
+
+    raw_state = _pull_state_bytes(working_dir)
+    ctx.output.print_code(raw_state.decode(), "json")
+
+
+def _state_pull_to_file(working_dir: str | None, output_file: str) -> None:
+    """Pull state into output_file without holding it in memory."""
+    out_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_file = tempfile.mkstemp(prefix=".devctl-tfstate-", dir=out_dir)
+    os.close(fd)
+    try:
+        result = _run_terraform(_ARGS_STATE_PULL, cwd=working_dir, stdout_file=tmp_file)
+        if result.returncode != 0:
+            raise TerraformError(f"Pull failed: {result.stderr}")
+
+        os.replace(tmp_file, output_file)
+    finally:
+        Path(tmp_file).unlink(missing_ok=True)
 
 
 # ============================================================================
@@ -519,31 +1140,17 @@ def workspace(ctx: DevCtlContext) -> None:
 @pass_context
 def workspace_list(ctx: DevCtlContext, working_dir: str | None) -> None:
     """List workspaces."""
-    args = ["workspace", "list"]
+    args = _ARGS_WORKSPACE_LIST
 
     result = _run_terraform(args, cwd=working_dir)
 
     if result.returncode != 0:
         raise TerraformError(f"Failed to list workspaces: {result.stderr}")
 
-    workspaces = []
-    current = None
-
-    for line in result.stdout.strip().split("\n"):
-        line = line.strip()
-        if line.startswith("*"):
-            ws = line[1:].strip()
-            current = ws
-            workspaces.append(ws)
-        elif line:
-            workspaces.append(line)
-
-    data = []
-    for ws in workspaces:
-        data.append({
-            "Workspace": ws,
-            "Current": "[green]Yes[/green]" if ws == current else "No",
-        })
+    data = [
+        {"Workspace": ws, "Current": "[green]Yes[/green]" if marker else "No"}
+        for marker, ws in _WORKSPACE_LINE.findall(result.stdout)
+    ]
 
     ctx.output.print_data(
         data,
@@ -558,7 +1165,7 @@ def workspace_list(ctx: DevCtlContext, working_dir: str | None) -> None:
 @pass_context
 def workspace_select(ctx: DevCtlContext, name: str, working_dir: str | None) -> None:
     """Select a workspace."""
-    args = ["workspace", "select", name]
+    args = [*_ARGS_WORKSPACE_SELECT, name]
 
     if ctx.dry_run:
         ctx.output.print_info(f"Would switch to workspace: {name}")
@@ -578,7 +1185,7 @@ def workspace_select(ctx: DevCtlContext, name: str, working_dir: str | None) ->
 @pass_context
 def workspace_new(ctx: DevCtlContext, name: str, working_dir: str | None) -> None:
     """Create a new workspace."""
-    args = ["workspace", "new", name]
+    args = [*_ARGS_WORKSPACE_NEW, name]
 
     if ctx.dry_run:
         ctx.output.print_info(f"Would create workspace: {name}")
@@ -603,7 +1210,7 @@ def workspace_delete(ctx: DevCtlContext, name: str, working_dir: str | None, for
     if name == current:
         raise TerraformError(f"Cannot delete current workspace. Switch to another first.")
 
-    args = ["workspace", "delete"]
+    args = list(_ARGS_WORKSPACE_DELETE)
     if force:
         args.append("-force")
     args.append(name)
@@ -628,24 +1235,53 @@ def workspace_delete(ctx: DevCtlContext, name: str, working_dir: str | None, for
 @terraform.command()
 @click.option("--dir", "-d", "working_dir", type=click.Path(exists=True), help="Terraform directory")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-@click.argument("name", required=False)
+@click.option("--no-cache", is_flag=True, help="Pull fresh state instead of a recent cached copy")
+@click.argument("names", nargs=-1)
 @pass_context
-def output(ctx: DevCtlContext, working_dir: str | None, as_json: bool, name: str | None) -> None:
+def output(
+    ctx: DevCtlContext,
+    working_dir: str | None,
+    as_json: bool,
+    no_cache: bool,
+    names: tuple[str, ...],
+) -> None:
     """Show terraform outputs.
 
+    JSON output is read from the (briefly cached) pulled state; the plain
+    format is rendered by terraform itself. Several names are fetched with
+    a single terraform run.
+
     \b
     Examples:
         devctl terraform output
         devctl terraform output vpc_id
+        devctl terraform output vpc_id subnet_ids
         devctl terraform output --json
     """
-    args = ["output"]
-
     if as_json:
-        args.append("-json")
+        outputs = _cached_state_pull(working_dir, use_cache=not no_cache).get("outputs", {})
+        missing = [n for n in names if n not in outputs]
+        if missing:
+            raise TerraformError(f"Output not found: {', '.join(missing)}")
+        if len(names) == 1:
+            ctx.output.print_code(json_dumps_pretty(outputs[names[0]].get("value")), "json")
+        elif names:
+            selected = {n: outputs[n].get("value") for n in names}
+            ctx.output.print_code(json_dumps_pretty(selected), "json")
+        elif not outputs:
+            ctx.output.print_info("No outputs defined")
+        else:
+            ctx.output.print_code(json_dumps_pretty(outputs), "json")
+        return
+
+    if len(names) > 1:
+        _print_named_outputs(ctx, names, working_dir)
+        return
 
-    if name:
-        args.append(name)
+    args = list(_ARGS_OUTPUT)
+
+    if names:
+        args.append(names[0])
 
     result = _run_terraform(args, cwd=working_dir)
 
@@ -655,10 +1291,38 @@ def output(ctx: DevCtlContext, working_dir: str | None, as_json: bool, name: str
             return
         raise TerraformError(f"Failed to get outputs: {result.stderr}")
 
-    if as_json:
-        ctx.output.print_code(result.stdout, "json")
-    else:
-        ctx.output.print(result.stdout)
+    ctx.output.print(result.stdout)
+
+
+def _print_named_outputs(ctx: DevCtlContext, names: tuple[str, ...], working_dir: str | None) -> None:
+    """Print several outputs from one `terraform output -json` run.
+
+    Sensitive values are masked, as terraform does in its plain format.
+    """
+    result = _run_terraform([*_ARGS_OUTPUT, "-json"], cwd=working_dir)
+
+    if result.returncode != 0:
+        raise TerraformError(f"Failed to get outputs: {result.stderr}")
+
+    try:
+        outputs = json_loads(result.stdout) or {}
+    except ValueError as e:
+        raise TerraformError(f"Failed to parse outputs: {e}")
+
+    missing = [n for n in names if n not in outputs]
+    if missing:
+        raise TerraformError(f"Output not found: {', '.join(missing)}")
+
+    lines = []
+    for n in names:
+        if outputs[n].get("sensitive"):
+            value = "<sensitive>"
+        else:
+            value = json_dumps_pretty(outputs[n].get("value"))
+        lines.append(f"{n} = {value}")
+
+    # Values are printed verbatim, never as rich markup
+    ctx.output.print_ansi("\n".join(lines))
 
 
 # ============================================================================
@@ -691,8 +1355,7 @@ def import_resource(
     """
     args = ["import"]
 
-    for var in variables:
-        args.extend(["-var", var])
+    args.extend(_var_args(variables))
 
     args.extend([address, id])
 
@@ -703,6 +1366,7 @@ def import_resource(
         return
 
     result = _run_terraform(args, cwd=working_dir, capture=False)
+    _invalidate_state_cache(working_dir)
 
     if result.returncode != 0:
         raise TerraformError("Import failed")
@@ -710,6 +1374,94 @@ def import_resource(
     ctx.output.print_success(f"Successfully imported {address}")
 
 
+@terraform.command("import-batch")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--dir", "-d", "working_dir", type=click.Path(exists=True), help="Terraform directory")
+@click.option("--auto-approve", is_flag=True, help="Skip interactive approval")
+@click.option("--parallelism", type=int, default=10, help="Number of parallel operations")
+@pass_context
+def import_batch(
+    ctx: DevCtlContext,
+    file: str,
+    working_dir: str | None,
+    auto_approve: bool,
+    parallelism: int,
+) -> None:
+    """Import many existing resources in one terraform run.
+
+    FILE is a YAML list of {address, id} entries. They are written as
+    import blocks (Terraform 1.5+) to a temporary file in the working
+    directory and applied with -target for each address, so terraform
+    imports them concurrently under a single state lock and write. The
+    apply is restricted to the imported resources; review the plan before
+    approving, since it also shows any drift from their configuration.
+    With --dry-run the imports are only planned.
+
+    \b
+    Examples:
+        devctl terraform import-batch imports.yaml
+        devctl terraform import-batch imports.yaml --auto-approve
+    """
+    imports = _parse_imports(file)
+    import_file = Path(working_dir or ".") / IMPORT_BATCH_FILE
+    if import_file.exists():
+        raise TerraformError(f"{import_file} already exists; remove it and retry")
+
+    ctx.output.print_info(f"Importing {len(imports)} resources")
+
+    command = "plan" if ctx.dry_run else "apply"
+    args = _build_tf_args(
+        command,
+        targets=tuple(address for address, _ in imports),
+        options={"-auto-approve": auto_approve and not ctx.dry_run, "-parallelism": parallelism},
+    )
+
+    import_file.write_text("".join(_import_block(address, id) for address, id in imports))
+    try:
+        if ctx.dry_run:
+            line_callback = _prompt_safe_callback(ctx)
+        else:
+            line_callback = ctx.output.print_ansi if auto_approve else None
+        result = _run_terraform(args, cwd=working_dir, capture=False, line_callback=line_callback)
+    finally:
+        import_file.unlink(missing_ok=True)
+        if not ctx.dry_run:
+            _invalidate_state_cache(working_dir)
+
+    if result.returncode != 0:
+        raise TerraformError("Import failed")
+
+    if not ctx.dry_run:
+        ctx.output.print_success(f"Imported {len(imports)} resources")
+
+
+def _parse_imports(file: str) -> list[tuple[str, str]]:
+    """Read (address, id) pairs from an import-batch YAML file."""
+    with open(file) as f:
+        entries = yaml.safe_load(f) or []
+
+    if not isinstance(entries, list):
+        raise click.BadParameter("Expected a list of imports", param_hint="FILE")
+
+    imports = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("address") or not entry.get("id"):
+            raise click.BadParameter(f"Invalid import: {entry}", param_hint="FILE")
+        imports.append((str(entry["address"]), str(entry["id"])))
+
+    if not imports:
+        raise click.BadParameter("No imports listed", param_hint="FILE")
+
+    return imports
+
+
+def _import_block(address: str, id: str) -> str:
+    """Render a terraform import block."""
+    # JSON string escaping is valid HCL; template sequences need doubling
+    literal = json.dumps(id).replace("${", "$${").replace("%{", "%%{")
+    return f"import {{\n  to = {address}\n  id = {literal}\n}}\n\n"
+
+
 # ============================================================================
 # Providers Command
 # ============================================================================
@@ -725,7 +1477,7 @@ def providers(ctx: DevCtlContext, working_dir: str | None) -> None:
     Examples:
         devctl terraform providers
     """
-    args = ["providers"]
+    args = _ARGS_PROVIDERS
 
     result = _run_terraform(args, cwd=working_dir)
 
@@ -753,7 +1505,7 @@ def graph(ctx: DevCtlContext, working_dir: str | None, graph_type: str, output_f
         devctl terraform graph
         devctl terraform graph --out graph.dot
     """
-    args = ["graph", f"-type={graph_type}"]
+    args = [*_ARGS_GRAPH, f"-type={graph_type}"]
 
     result = _run_terraform(args, cwd=working_dir)
 
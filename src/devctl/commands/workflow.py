@@ -1,15 +1,57 @@
 """Workflow commands."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import click
 import yaml
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
+from devctl.config import WorkflowConfig
 from devctl.core.context import pass_context, DevCtlContext
 from devctl.core.exceptions import WorkflowError
 from devctl.core.utils import parse_key_value_pairs
-from devctl.workflows import WorkflowEngine, validate_workflow
+
+
+# Built-in workflow templates shipped with devctl
+TEMPLATES_DIR = Path(__file__).parent.parent / "workflows" / "templates"
+
+
+def _template_files() -> tuple[Path, ...]:
+    """List the built-in templates, reusing the listing while the directory is unchanged."""
+    try:
+        mtime_ns = os.stat(TEMPLATES_DIR).st_mtime_ns
+    except OSError:
+        return ()
+    return _template_files_cached(mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _template_files_cached(dir_mtime_ns: int) -> tuple[Path, ...]:  # noqa: ARG001
+    """Glob the templates directory; dir_mtime_ns only keys the cache."""
+    return tuple(sorted(TEMPLATES_DIR.glob("*.yaml")))
+
+
+def _yaml_load(path: str | Path) -> Any:
+    """Parse a YAML file, reusing the result while the file is unchanged.
+
+    Callers must not mutate the returned document.
+    """
+    path = os.fspath(path)
+    return _yaml_load_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _yaml_load_cached(path: str, mtime_ns: int) -> Any:  # noqa: ARG001
+    """Parse a YAML file; mtime_ns only keys the cache."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAMLLoader)
 
 
 @click.group()
@@ -29,16 +71,22 @@ def workflow(ctx: DevCtlContext) -> None:
 @workflow.command()
 @click.argument("name_or_file")
 @click.option("--var", "-v", multiple=True, help="Variables (KEY=VALUE)")
+@click.option("--no-coalesce", is_flag=True, help="Run adjacent targeted terraform steps separately")
 @pass_context
-def run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...]) -> None:
+def run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...], no_coalesce: bool) -> None:
     """Run a workflow.
 
     NAME_OR_FILE can be a workflow name from config or a path to a YAML file.
+
+    Adjacent `terraform apply` (or `terraform plan`) steps that differ only
+    in their `target` param are merged into one terraform run unless
+    --no-coalesce is given.
     """
     # Parse variables
     variables = parse_key_value_pairs(list(var))
 
     # Check if it's a file path
+    workflow_path: str | None = None
     if Path(name_or_file).exists():
         workflow_path = name_or_file
     else:
@@ -47,34 +95,16 @@ def run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...]) -> None:
         if name_or_file not in workflows:
             raise WorkflowError(f"Workflow not found: {name_or_file}")
 
-        # Create temporary file from config workflow
-        workflow_config = workflows[name_or_file]
-        workflow_dict = {
-            "name": name_or_file,
-            "description": workflow_config.description,
-            "steps": [
-                {
-                    "name": step.name,
-                    "command": step.command,
-                    "params": step.params,
-                    "on_failure": step.on_failure,
-                    "condition": step.condition,
-                    "timeout": step.timeout,
-                }
-                for step in workflow_config.steps
-            ],
-            "vars": workflow_config.vars,
-        }
+        workflow_dict = _config_workflow_dict(name_or_file, workflows[name_or_file])
 
-        # Save to temp file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(workflow_dict, f)
-            workflow_path = f.name
+    from devctl.workflows import WorkflowEngine
 
     try:
         engine = WorkflowEngine(ctx)
-        workflow_schema = engine.load_workflow(workflow_path)
+        if workflow_path:
+            workflow_schema = engine.load_workflow(workflow_path, coalesce=not no_coalesce)
+        else:
+            workflow_schema = engine.load_workflow_dict(workflow_dict, coalesce=not no_coalesce)
         result = engine.run(workflow_schema, variables, dry_run=ctx.dry_run)
 
         if not result["success"]:
@@ -84,14 +114,25 @@ def run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...]) -> None:
         raise WorkflowError(f"Workflow execution failed: {e}")
 
 
+def _config_workflow_dict(name: str, workflow_config: WorkflowConfig) -> dict[str, Any]:
+    """Build a workflow definition from a workflow in the config file.
+
+    WorkflowStep has the same fields as a workflow file step, so pydantic
+    dumps the whole definition in one pass.
+    """
+    return {"name": name, **workflow_config.model_dump()}
+
+
 @workflow.command("dry-run")
 @click.argument("name_or_file")
 @click.option("--var", "-v", multiple=True, help="Variables (KEY=VALUE)")
+@click.option("--no-coalesce", is_flag=True, help="Run adjacent targeted terraform steps separately")
 @pass_context
-def dry_run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...]) -> None:
+def dry_run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...], no_coalesce: bool) -> None:
     """Dry-run a workflow without executing commands."""
     variables = parse_key_value_pairs(list(var))
 
+    workflow_path: str | None = None
     if Path(name_or_file).exists():
         workflow_path = name_or_file
     else:
@@ -99,28 +140,15 @@ def dry_run(ctx: DevCtlContext, name_or_file: str, var: tuple[str, ...]) -> None
         if name_or_file not in workflows:
             raise WorkflowError(f"Workflow not found: {name_or_file}")
 
-        workflow_config = workflows[name_or_file]
-        workflow_dict = {
-            "name": name_or_file,
-            "description": workflow_config.description,
-            "steps": [
-                {
-                    "name": step.name,
-                    "command": step.command,
-                    "params": step.params,
-                }
-                for step in workflow_config.steps
-            ],
-            "vars": workflow_config.vars,
-        }
+        workflow_dict = _config_workflow_dict(name_or_file, workflows[name_or_file])
 
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(workflow_dict, f)
-            workflow_path = f.name
+    from devctl.workflows import WorkflowEngine
 
     engine = WorkflowEngine(ctx)
-    workflow_schema = engine.load_workflow(workflow_path)
+    if workflow_path:
+        workflow_schema = engine.load_workflow(workflow_path, coalesce=not no_coalesce)
+    else:
+        workflow_schema = engine.load_workflow_dict(workflow_dict, coalesce=not no_coalesce)
     engine.run(workflow_schema, variables, dry_run=True)
 
 
@@ -131,13 +159,8 @@ def list_workflows(ctx: DevCtlContext, templates: bool) -> None:
     """List configured workflows or built-in templates."""
     if templates:
         # List built-in templates
-        import importlib.resources
-        try:
-            # Python 3.9+
-            templates_path = Path(__file__).parent.parent / "workflows" / "templates"
-            template_files = list(templates_path.glob("*.yaml"))
-        except Exception:
-            template_files = []
+        templates_path = TEMPLATES_DIR
+        template_files = _template_files()
 
         if not template_files:
             ctx.output.print_info("No built-in templates found")
@@ -146,8 +169,7 @@ def list_workflows(ctx: DevCtlContext, templates: bool) -> None:
         data = []
         for tf in template_files:
             try:
-                with open(tf) as f:
-                    content = yaml.safe_load(f)
+                content = _yaml_load(tf)
                 data.append({
                     "Template": tf.stem,
                     "Description": (content.get("description", "-") or "-")[:50],
@@ -199,9 +221,10 @@ def list_workflows(ctx: DevCtlContext, templates: bool) -> None:
 @pass_context
 def validate(ctx: DevCtlContext, file: str) -> None:
     """Validate a workflow YAML file."""
+    from devctl.workflows import validate_workflow
+
     try:
-        with open(file) as f:
-            workflow_dict = yaml.safe_load(f)
+        workflow_dict = _yaml_load(file)
 
         schema = validate_workflow(workflow_dict)
 
@@ -218,14 +241,15 @@ def validate(ctx: DevCtlContext, file: str) -> None:
 
         # Show steps
         if schema.steps:
-            step_data = []
-            for i, step in enumerate(schema.steps):
-                step_data.append({
-                    "Step": i + 1,
+            step_data = [
+                {
+                    "Step": i,
                     "Name": step.name,
-                    "Command": step.command[:30],
+                    "Command": (step.command or "")[:30],
                     "OnFailure": step.on_failure,
-                })
+                }
+                for i, step in enumerate(schema.steps, 1)
+            ]
             ctx.output.print_data(step_data, headers=["Step", "Name", "Command", "OnFailure"], title="Steps")
 
     except yaml.YAMLError as e:
@@ -279,12 +303,11 @@ def show_template(ctx: DevCtlContext, name: str, output: str | None) -> None:
         devctl workflow template predictive-scaling
         devctl workflow template predictive-scaling -o ./my-workflow.yaml
     """
-    templates_path = Path(__file__).parent.parent / "workflows" / "templates"
-    template_file = templates_path / f"{name}.yaml"
+    template_file = TEMPLATES_DIR / f"{name}.yaml"
 
     if not template_file.exists():
         # Try without .yaml extension
-        available = [f.stem for f in templates_path.glob("*.yaml")]
+        available = [f.stem for f in _template_files()]
         ctx.output.print_error(f"Template not found: {name}")
         if available:
             ctx.output.print_info(f"Available templates: {', '.join(available)}")
@@ -1,18 +1,36 @@
 """Configuration management for devctl using Pydantic."""
 
 import os
+import tomllib
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
 from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from devctl.core.exceptions import ConfigError
 from devctl.core.output import OutputFormat
+from devctl.core.utils import json_loads
 from devctl.core.logging import LogLevel
 
 
+@cache
+def _env(*keys: str) -> str | None:
+    """First non-empty environment variable among keys.
+
+    Lookups are cached since the environment does not change while devctl
+    runs; ConfigLoader.load() clears the cache so a reload sees changes.
+    """
+    return next((value for key in keys if (value := os.environ.get(key))), None)
+
+
 class AWSConfig(BaseModel):
     """AWS configuration."""
 
@@ -25,20 +43,11 @@ class AWSConfig(BaseModel):
 
     def get_profile(self) -> str | None:
         """Get AWS profile from config or environment."""
-        return (
-            os.environ.get("DEVCTL_AWS_PROFILE")
-            or os.environ.get("AWS_PROFILE")
-            or self.profile
-        )
+        return _env("DEVCTL_AWS_PROFILE", "AWS_PROFILE") or self.profile
 
     def get_region(self) -> str | None:
         """Get AWS region from config or environment."""
-        return (
-            os.environ.get("DEVCTL_AWS_REGION")
-            or os.environ.get("AWS_REGION")
-            or os.environ.get("AWS_DEFAULT_REGION")
-            or self.region
-        )
+        return _env("DEVCTL_AWS_REGION", "AWS_REGION", "AWS_DEFAULT_REGION") or self.region
 
 
 class GrafanaConfig(BaseModel):
@@ -51,13 +60,13 @@ class GrafanaConfig(BaseModel):
 
     def get_url(self) -> str | None:
         """Get Grafana URL from config or environment."""
-        return os.environ.get("DEVCTL_GRAFANA_URL") or os.environ.get("GRAFANA_URL") or self.url
+        return _env("DEVCTL_GRAFANA_URL", "GRAFANA_URL") or self.url
 
     def get_api_key(self) -> str | None:
         """Get API key from config or environment."""
         key = self.api_key
         if key == "from_env" or key is None:
-            key = os.environ.get("DEVCTL_GRAFANA_API_KEY") or os.environ.get("GRAFANA_API_KEY")
+            key = _env("DEVCTL_GRAFANA_API_KEY", "GRAFANA_API_KEY")
         return key
 
 
@@ -73,16 +82,12 @@ class GitHubConfig(BaseModel):
         """Get GitHub token from config or environment."""
         token = self.token
         if token == "from_env" or token is None:
-            token = (
-                os.environ.get("DEVCTL_GITHUB_TOKEN")
-                or os.environ.get("GITHUB_TOKEN")
-                or os.environ.get("GH_TOKEN")
-            )
+            token = _env("DEVCTL_GITHUB_TOKEN", "GITHUB_TOKEN", "GH_TOKEN")
         return token
 
     def get_org(self) -> str | None:
         """Get GitHub org from config or environment."""
-        return os.environ.get("DEVCTL_GITHUB_ORG") or os.environ.get("GITHUB_ORG") or self.org
+        return _env("DEVCTL_GITHUB_ORG", "GITHUB_ORG") or self.org
 
 
 class JiraConfig(BaseModel):
@@ -95,28 +100,17 @@ class JiraConfig(BaseModel):
 
     def get_url(self) -> str | None:
         """Get Jira URL from config or environment."""
-        return (
-            os.environ.get("DEVCTL_JIRA_URL")
-            or os.environ.get("JIRA_URL")
-            or self.url
-        )
+        return _env("DEVCTL_JIRA_URL", "JIRA_URL") or self.url
 
     def get_email(self) -> str | None:
         """Get Jira email from config or environment."""
-        return (
-            os.environ.get("DEVCTL_JIRA_EMAIL")
-            or os.environ.get("JIRA_EMAIL")
-            or self.email
-        )
+        return _env("DEVCTL_JIRA_EMAIL", "JIRA_EMAIL") or self.email
 
     def get_api_token(self) -> str | None:
         """Get Jira API token from config or environment."""
         token = self.api_token
         if token == "from_env" or token is None:
-            token = (
-                os.environ.get("DEVCTL_JIRA_API_TOKEN")
-                or os.environ.get("JIRA_API_TOKEN")
-            )
+            token = _env("DEVCTL_JIRA_API_TOKEN", "JIRA_API_TOKEN")
         return token
 
 
@@ -130,27 +124,15 @@ class K8sConfig(BaseModel):
 
     def get_kubeconfig(self) -> str | None:
         """Get kubeconfig path from config or environment."""
-        return (
-            os.environ.get("DEVCTL_KUBECONFIG")
-            or os.environ.get("KUBECONFIG")
-            or self.kubeconfig
-        )
+        return _env("DEVCTL_KUBECONFIG", "KUBECONFIG") or self.kubeconfig
 
     def get_context(self) -> str | None:
         """Get k8s context from config or environment."""
-        return (
-            os.environ.get("DEVCTL_K8S_CONTEXT")
-            or os.environ.get("K8S_CONTEXT")
-            or self.context
-        )
+        return _env("DEVCTL_K8S_CONTEXT", "K8S_CONTEXT") or self.context
 
     def get_namespace(self) -> str:
         """Get default namespace from config or environment."""
-        return (
-            os.environ.get("DEVCTL_K8S_NAMESPACE")
-            or os.environ.get("K8S_NAMESPACE")
-            or self.namespace
-        )
+        return _env("DEVCTL_K8S_NAMESPACE", "K8S_NAMESPACE") or self.namespace
 
 
 class PagerDutyConfig(BaseModel):
@@ -165,28 +147,16 @@ class PagerDutyConfig(BaseModel):
         """Get API key from config or environment."""
         key = self.api_key
         if key == "from_env" or key is None:
-            key = (
-                os.environ.get("DEVCTL_PAGERDUTY_API_KEY")
-                or os.environ.get("PAGERDUTY_API_KEY")
-                or os.environ.get("PD_API_KEY")
-            )
+            key = _env("DEVCTL_PAGERDUTY_API_KEY", "PAGERDUTY_API_KEY", "PD_API_KEY")
         return key
 
     def get_service_id(self) -> str | None:
         """Get default service ID."""
-        return (
-            os.environ.get("DEVCTL_PAGERDUTY_SERVICE_ID")
-            or os.environ.get("PAGERDUTY_SERVICE_ID")
-            or self.service_id
-        )
+        return _env("DEVCTL_PAGERDUTY_SERVICE_ID", "PAGERDUTY_SERVICE_ID") or self.service_id
 
     def get_email(self) -> str | None:
         """Get user email for API requests."""
-        return (
-            os.environ.get("DEVCTL_PAGERDUTY_EMAIL")
-            or os.environ.get("PAGERDUTY_EMAIL")
-            or self.email
-        )
+        return _env("DEVCTL_PAGERDUTY_EMAIL", "PAGERDUTY_EMAIL") or self.email
 
 
 class LogsConfig(BaseModel):
@@ -211,20 +181,13 @@ class ArgoCDConfig(BaseModel):
 
     def get_url(self) -> str | None:
         """Get ArgoCD URL from config or environment."""
-        return (
-            os.environ.get("DEVCTL_ARGOCD_URL")
-            or os.environ.get("ARGOCD_SERVER")
-            or self.url
-        )
+        return _env("DEVCTL_ARGOCD_URL", "ARGOCD_SERVER") or self.url
 
     def get_token(self) -> str | None:
         """Get ArgoCD token from config or environment."""
         token = self.token
         if token == "from_env" or token is None:
-            token = (
-                os.environ.get("DEVCTL_ARGOCD_TOKEN")
-                or os.environ.get("ARGOCD_AUTH_TOKEN")
-            )
+            token = _env("DEVCTL_ARGOCD_TOKEN", "ARGOCD_AUTH_TOKEN")
         return token
 
 
@@ -273,7 +236,7 @@ class DeployConfig(BaseModel):
 
     def get_cluster(self) -> str | None:
         """Get cluster from config or environment."""
-        return os.environ.get("DEVCTL_DEPLOY_CLUSTER") or self.cluster
+        return _env("DEVCTL_DEPLOY_CLUSTER") or self.cluster
 
 
 class SlackConfig(BaseModel):
@@ -289,11 +252,7 @@ class SlackConfig(BaseModel):
         """Get Slack bot token from config or environment."""
         token = self.token
         if token == "from_env" or token is None:
-            token = (
-                os.environ.get("DEVCTL_SLACK_TOKEN")
-                or os.environ.get("SLACK_BOT_TOKEN")
-                or os.environ.get("SLACK_TOKEN")
-            )
+            token = _env("DEVCTL_SLACK_TOKEN", "SLACK_BOT_TOKEN", "SLACK_TOKEN")
         return token
 
 
@@ -308,28 +267,17 @@ class ConfluenceConfig(BaseModel):
 
     def get_url(self) -> str | None:
         """Get Confluence URL from config or environment."""
-        return (
-            os.environ.get("DEVCTL_CONFLUENCE_URL")
-            or os.environ.get("CONFLUENCE_URL")
-            or self.url
-        )
+        return _env("DEVCTL_CONFLUENCE_URL", "CONFLUENCE_URL") or self.url
 
     def get_email(self) -> str | None:
         """Get Confluence email from config or environment."""
-        return (
-            os.environ.get("DEVCTL_CONFLUENCE_EMAIL")
-            or os.environ.get("CONFLUENCE_EMAIL")
-            or self.email
-        )
+        return _env("DEVCTL_CONFLUENCE_EMAIL", "CONFLUENCE_EMAIL") or self.email
 
     def get_api_token(self) -> str | None:
         """Get Confluence API token from config or environment."""
         token = self.api_token
         if token == "from_env" or token is None:
-            token = (
-                os.environ.get("DEVCTL_CONFLUENCE_API_TOKEN")
-                or os.environ.get("CONFLUENCE_API_TOKEN")
-            )
+            token = _env("DEVCTL_CONFLUENCE_API_TOKEN", "CONFLUENCE_API_TOKEN")
         return token
 
 
@@ -423,18 +371,30 @@ class DevCtlConfig(BaseModel):
     def get_profile(self, name: str | None = None) -> ProfileConfig:
         """Get a profile by name, defaulting to 'default'."""
         profile_name = name or "default"
-        if profile_name not in self.profiles:
+        profile = self.profiles.get(profile_name)
+        if profile is None:
             raise ConfigError(f"Profile '{profile_name}' not found")
-        return self.profiles[profile_name]
+        return profile
 
 
 class ConfigLoader:
     """Loads and merges configuration from multiple sources."""
 
-    CONFIG_FILENAMES = ["devctl.yaml", "devctl.yml", ".devctl.yaml", ".devctl.yml"]
+    CONFIG_FILENAMES = [
+        "devctl.toml",
+        "devctl.yaml",
+        "devctl.yml",
+        "devctl.json",
+        ".devctl.toml",
+        ".devctl.yaml",
+        ".devctl.yml",
+        ".devctl.json",
+    ]
+    USER_CONFIG_FILENAMES = ["config.toml", "config.yaml", "config.json"]
 
     def __init__(self):
         self._config: DevCtlConfig | None = None
+        self._cache: dict[tuple[Any, ...], DevCtlConfig] = {}
 
     def load(
         self,
@@ -445,8 +405,14 @@ class ConfigLoader:
 
         Priority (highest to lowest):
         1. Explicitly specified config file
-        2. Project config (./devctl.yaml)
-        3. User config (~/.devctl/config.yaml)
+        2. Project config (./devctl.toml or ./devctl.yaml)
+        3. User config (~/.devctl/config.toml or ~/.devctl/config.yaml)
+
+        Files ending in .toml are read as TOML, .json as JSON, and
+        anything else as YAML.
+        The merged config is reused until one of the files that went into
+        it changes (or a different one is found); callers must treat it as
+        read-only. Call reload() to force a rebuild.
 
         Args:
             config_file: Optional explicit config file path
@@ -455,76 +421,148 @@ class ConfigLoader:
         Returns:
             Merged configuration
         """
-        configs: list[dict[str, Any]] = []
-
-        # Load user config
-        user_config_path = Path.home() / ".devctl" / "config.yaml"
-        if user_config_path.exists():
-            configs.append(self._load_yaml_file(user_config_path))
-
-        # Load project config
+        _env.cache_clear()
+        paths: list[Path] = []
+
+        # User config
+        user_config_dir = Path.home() / ".devctl"
+        for filename in self.USER_CONFIG_FILENAMES:
+            user_config_path = user_config_dir / filename
+            if user_config_path.exists():
+                paths.append(user_config_path)
+                break
+
+        # Project config
         project_config = self._find_project_config()
         if project_config:
-            configs.append(self._load_yaml_file(project_config))
+            paths.append(project_config)
 
-        # Load explicit config file
+        # Explicit config file
         if config_file:
             config_path = Path(config_file)
             if not config_path.exists():
                 raise ConfigError(f"Config file not found: {config_file}")
-            configs.append(self._load_yaml_file(config_path))
-
-        # Merge all configs
-        merged = self._merge_configs(configs)
+            paths.append(config_path)
 
-        # Create config object
-        self._config = DevCtlConfig(**merged)
-        return self._config
+        key = (
+            str(config_file) if config_file else None,
+            profile,
+            tuple(self._file_key(path) for path in paths),
+        )
+        config = self._cache.get(key)
+        if config is None:
+            merged = self._merge_configs([self._load_config_file(path) for path in paths])
+            config = self._cache[key] = DevCtlConfig(**merged)
+
+        self._config = config
+        return config
+
+    def reload(self) -> None:
+        """Forget cached configs so the next load() re-reads every file."""
+        self._cache.clear()
+        self._config = None
+        _env.cache_clear()
+
+    @staticmethod
+    def _file_key(path: Path) -> tuple[str, int, int]:
+        """Cache key for a config file's current contents."""
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            raise ConfigError(f"Cannot read {path}: {e}")
+        return (str(path), st.st_mtime_ns, st.st_size)
 
     def _find_project_config(self) -> Path | None:
-        """Find project config file in current or parent directories."""
+        """Find project config file in current or parent directories.
+
+        Each directory is listed once rather than probing every candidate
+        filename with its own stat call.
+        """
         current = Path.cwd()
 
         while current != current.parent:
+            try:
+                with os.scandir(current) as it:
+                    names = {entry.name for entry in it if not entry.is_dir()}
+            except OSError:
+                names = set()
+
             for filename in self.CONFIG_FILENAMES:
-                config_path = current / filename
-                if config_path.exists():
-                    return config_path
+                if filename in names:
+                    return current / filename
             current = current.parent
 
         return None
 
-    def _load_yaml_file(self, path: Path) -> dict[str, Any]:
-        """Load a YAML config file."""
+    def _load_config_file(self, path: Path) -> dict[str, Any]:
+        """Load a config file as TOML, JSON or YAML, going by its suffix.
+
+        Parsed files are reused until their mtime or size changes. The
+        returned dict is shared and must not be modified.
+        """
         try:
-            with open(path) as f:
-                content = yaml.safe_load(f) or {}
-                return content
+            st = os.stat(path)
+            if path.suffix == ".toml":
+                return _parse_toml_file(str(path), st.st_mtime_ns, st.st_size)
+            if path.suffix == ".json":
+                return _parse_json_file(str(path), st.st_mtime_ns, st.st_size)
+            return _parse_yaml_file(str(path), st.st_mtime_ns, st.st_size)
+        except tomllib.TOMLDecodeError as e:
+            raise ConfigError(f"Invalid TOML in {path}: {e}")
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in {path}: {e}")
         except OSError as e:
             raise ConfigError(f"Cannot read {path}: {e}")
+        except ValueError as e:
+            raise ConfigError(f"Invalid JSON in {path}: {e}")
 
     def _merge_configs(self, configs: list[dict[str, Any]]) -> dict[str, Any]:
         """Deep merge multiple configuration dictionaries."""
         result: dict[str, Any] = {}
         for config in configs:
-            result = self._deep_merge(result, config)
+            self._deep_merge_into(result, config)
         return result
 
-    def _deep_merge(
-        self,
-        base: dict[str, Any],
-        override: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        return result
+    def _deep_merge_into(self, dest: dict[str, Any], override: dict[str, Any]) -> None:
+        """Deep merge override into dest, in place.
+
+        Nested dicts from override are copied as they are merged rather
+        than stored by reference, so dest never shares a dict with the
+        (cached) parsed config files.
+        """
+        stack = [(dest, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    if not isinstance(dst.get(key), dict):
+                        dst[key] = {}
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a YAML config file; mtime_ns and size only key the cache.
+
+    Config files are small, so they are read in one call and libyaml
+    parses the bytes without calling back into a Python file object.
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=YAMLLoader) or {}
+
+
+@lru_cache(maxsize=32)
+def _parse_toml_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a TOML config file; mtime_ns and size only key the cache."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=32)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a JSON config file; mtime_ns and size only key the cache."""
+    return json_loads(Path(path).read_bytes()) or {}
 
 
 # Global config loader instance
@@ -1,8 +1,12 @@
 """Async utilities for bulk operations."""
 
 import asyncio
-from collections.abc import Awaitable, Callable, Iterable
-from typing import TypeVar
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -21,13 +25,7 @@ async def gather_with_concurrency(
     Returns:
         List of results in the same order as input
     """
-    semaphore = asyncio.Semaphore(n)
-
-    async def sem_coro(coro: Awaitable[T]) -> T:
-        async with semaphore:
-            return await coro
-
-    return await asyncio.gather(*[sem_coro(coro) for coro in coros])
+    return await _run_bounded(n, coros, len(coros))
 
 
 async def map_async(
@@ -45,10 +43,33 @@ async def map_async(
     Returns:
         List of results
     """
-    return await gather_with_concurrency(
-        concurrency,
-        *[func(item) for item in items],
-    )
+    items = list(items)
+    return await _run_bounded(concurrency, (func(item) for item in items), len(items))
+
+
+async def _run_bounded(n: int, coros: Iterable[Awaitable[T]], count: int) -> list[T]:
+    """Await count coroutines from coros, at most n at a time, in order.
+
+    n worker tasks pull from a shared iterator, so only n tasks exist at
+    once and coroutines from a generator are created as a worker is free
+    to run them. Every coroutine is awaited; if any raised, the first
+    exception to occur is re-raised once all of them have finished.
+    """
+    results: list[T] = [None] * count  # type: ignore[list-item]
+    errors: list[BaseException] = []
+    work = enumerate(coros)
+
+    async def worker() -> None:
+        for i, coro in work:
+            try:
+                results[i] = await coro
+            except Exception as e:
+                errors.append(e)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, min(n, count)))])
+    if errors:
+        raise errors[0]
+    return results
 
 
 async def run_with_timeout(
@@ -77,10 +98,31 @@ async def run_with_timeout(
         raise TimeoutError(timeout_message, timeout_seconds=int(timeout))
 
 
-def run_sync(coro: Awaitable[T]) -> T:
+@lru_cache(maxsize=1)
+def _bridge_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop that runs run_sync() calls made from async code.
+
+    The loop is started on first use in a daemon thread and lives for the
+    rest of the process.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="devctl-bridge", daemon=True).start()
+    return loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
     """Run an async function synchronously.
 
-    This is useful for integrating async code with Click commands.
+    This is useful for integrating async code with Click commands. When
+    called from inside a running event loop, the coroutine runs on a
+    shared bridge loop in another thread rather than a new thread and
+    loop per call.
+
+    Coroutines bridged this way share that one loop with every other
+    bridged call, from any thread, so they must not block (no blocking
+    I/O or time.sleep; use run_in_executor or asyncio.sleep). Unlike
+    asyncio.run, tasks they spawn and leave running are not cancelled
+    when run_sync returns.
 
     Args:
         coro: Coroutine to run
@@ -93,16 +135,20 @@ def run_sync(coro: Awaitable[T]) -> T:
     except RuntimeError:
         loop = None
 
-    if loop and loop.is_running():
-        # If we're already in an async context, create a new loop
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(asyncio.run, coro)
-            return future.result()
-    else:
+    if loop is None or not loop.is_running():
         return asyncio.run(coro)
 
+    bridge = _bridge_loop()
+    if loop is not bridge:
+        return asyncio.run_coroutine_threadsafe(coro, bridge).result()
+
+    # Called from a coroutine already on the bridge loop, which cannot
+    # wait on itself: fall back to a one-off thread and loop
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
 
 class AsyncBatcher:
     """Batch async operations for efficiency."""
@@ -129,7 +175,9 @@ class AsyncBatcher:
         Returns:
             Combined results from all batches
         """
-        results: list[R] = []
+        # A single batch needs no splitting or joining
+        if len(items) <= self.batch_size:
+            return list(await processor(items)) if items else []
 
         # Split into batches
         batches = [
@@ -139,10 +187,9 @@ class AsyncBatcher:
         # Process batches with limited concurrency
         batch_results = await map_async(processor, batches, self.concurrency)
 
-        for batch_result in batch_results:
-            results.extend(batch_result)
-
-        return results
+        # A processor may return more or fewer results than it was given,
+        # so results are joined rather than written at item offsets
+        return list(chain.from_iterable(batch_results))
 
 
 class RateLimiter:
@@ -152,18 +199,21 @@ class RateLimiter:
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
         self._last_call = 0.0
-        self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
-        """Wait for rate limit slot."""
-        async with self._lock:
-            import time
-
-            now = time.monotonic()
-            elapsed = now - self._last_call
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self._last_call = time.monotonic()
+        """Wait for rate limit slot.
+
+        The slot is reserved before sleeping, with no await in between,
+        so concurrent tasks on the same event loop queue up one interval
+        apart without needing a lock. A waiter that is cancelled keeps its
+        slot, so later callers are never scheduled closer together than
+        min_interval (at worst one slot goes unused).
+        """
+        now = time.monotonic()
+        slot = max(self._last_call + self.min_interval, now)
+        self._last_call = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def __aenter__(self) -> "RateLimiter":
         await self.acquire()
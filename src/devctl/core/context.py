@@ -32,6 +32,28 @@ class DevCtlContext:
     access to configuration, clients, and utilities.
     """
 
+    __slots__ = (
+        "_config",
+        "_profile_name",
+        "_profile",
+        "_output_format",
+        "_verbose",
+        "_quiet",
+        "_dry_run",
+        "_color",
+        "_logger",
+        "_output",
+        "_aws_factory",
+        "_grafana_client",
+        "_github_client",
+        "_jira_client",
+        "_k8s_client",
+        "_pagerduty_client",
+        "_argocd_client",
+        "_slack_client",
+        "_confluence_client",
+    )
+
     def __init__(
         self,
         config: DevCtlConfig | None = None,
@@ -45,6 +67,7 @@ class DevCtlContext:
         # Load or use provided config
         self._config = config or get_default_config()
         self._profile_name = profile or "default"
+        self._profile: ProfileConfig | None = None
 
         # Output settings (CLI overrides config)
         self._output_format = output_format or self._config.global_settings.output_format
@@ -92,8 +115,14 @@ class DevCtlContext:
 
     @property
     def profile(self) -> ProfileConfig:
-        """Get the current profile configuration."""
-        return self._config.get_profile(self._profile_name)
+        """Get the current profile configuration.
+
+        The profile is looked up on first access, so an unknown profile
+        name only fails commands that use it.
+        """
+        if self._profile is None:
+            self._profile = self._config.get_profile(self._profile_name)
+        return self._profile
 
     @property
     def profile_name(self) -> str:
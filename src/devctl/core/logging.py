@@ -5,9 +5,6 @@ import sys
 from enum import Enum
 from typing import Any
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 
 class LogLevel(str, Enum):
     """Log level enumeration."""
@@ -18,6 +15,14 @@ class LogLevel(str, Enum):
     ERROR = "error"
 
 
+_LOG_LEVEL_INT: dict[LogLevel, int] = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+}
+
+
 def setup_logging(
     level: LogLevel = LogLevel.INFO,
     rich_output: bool = True,
@@ -26,25 +31,29 @@ def setup_logging(
 
     Args:
         level: The logging level
-        rich_output: Whether to use Rich for formatted output
+        rich_output: Whether to use Rich for formatted output; ignored
+            (plain output is used) when stderr is not a terminal
 
     Returns:
         Configured logger instance
     """
-    log_level = getattr(logging, level.value.upper())
+    log_level = _LOG_LEVEL_INT[level]
 
     # Remove existing handlers
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    if rich_output:
+    if rich_output and sys.stderr.isatty():
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         handler = RichHandler(
             console=Console(stderr=True),
             show_time=True,
             show_path=False,
             rich_tracebacks=True,
-            tracebacks_show_locals=True,
+            tracebacks_show_locals=level == LogLevel.DEBUG,
         )
         handler.setFormatter(logging.Formatter("%(message)s"))
     else:
@@ -87,40 +96,54 @@ def get_logger(name: str) -> logging.Logger:
 class StructuredLogger:
     """Logger that supports structured logging with context."""
 
+    __slots__ = ("_logger", "_context")
+
     def __init__(self, name: str):
         self._logger = get_logger(name)
         self._context: dict[str, Any] = {}
 
     def bind(self, **kwargs: Any) -> "StructuredLogger":
-        """Create a new logger with additional context."""
-        new_logger = StructuredLogger(self._logger.name.replace("devctl.", ""))
-        new_logger._context = {**self._context, **kwargs}
+        """Create a new logger with additional context.
+
+        The new logger shares this one's underlying logger; binding
+        nothing returns this logger unchanged.
+        """
+        if not kwargs:
+            return self
+        new_logger = object.__new__(StructuredLogger)
+        new_logger._logger = self._logger
+        new_logger._context = self._context | kwargs
         return new_logger
 
     def _format_message(self, message: str, **kwargs: Any) -> str:
         """Format message with context."""
-        context = {**self._context, **kwargs}
+        context = self._context | kwargs if kwargs else self._context
         if context:
             context_str = " ".join(f"{k}={v}" for k, v in context.items())
             return f"{message} [{context_str}]"
         return message
 
+    def _log(self, level: int, message: str, kwargs: dict[str, Any], exc_info: bool = False) -> None:
+        """Log message at level, formatting the context only if it will be emitted."""
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, self._format_message(message, **kwargs), exc_info=exc_info)
+
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message."""
-        self._logger.debug(self._format_message(message, **kwargs))
+        self._log(logging.DEBUG, message, kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info message."""
-        self._logger.info(self._format_message(message, **kwargs))
+        self._log(logging.INFO, message, kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message."""
-        self._logger.warning(self._format_message(message, **kwargs))
+        self._log(logging.WARNING, message, kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message."""
-        self._logger.error(self._format_message(message, **kwargs))
+        self._log(logging.ERROR, message, kwargs)
 
     def exception(self, message: str, **kwargs: Any) -> None:
         """Log exception with traceback."""
-        self._logger.exception(self._format_message(message, **kwargs))
+        self._log(logging.ERROR, message, kwargs, exc_info=True)
@@ -1,5 +1,6 @@
 """Base classes for log source abstractions."""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -19,6 +20,38 @@ class LogLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Words that mark a message's severity, most severe level first
+_LEVEL_WORDS: dict[LogLevel, tuple[str, ...]] = {
+    LogLevel.CRITICAL: ("critical", "fatal", "panic"),
+    LogLevel.ERROR: ("error", "err", "exception", "fail"),
+    LogLevel.WARNING: ("warn", "warning"),
+    LogLevel.INFO: ("info",),
+    LogLevel.DEBUG: ("debug", "trace"),
+}
+_LEVEL_BY_WORD = {word: level for level, words in _LEVEL_WORDS.items() for word in words}
+_LEVEL_RANK = {level: rank for rank, level in enumerate(_LEVEL_WORDS)}
+_LEVEL_RE = re.compile(
+    r"\b(" + "|".join(sorted(_LEVEL_BY_WORD, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def detect_level(message: str) -> LogLevel | None:
+    """Detect log level from message content.
+
+    The most severe level named anywhere in the message wins, found in a
+    single scan of the message.
+    """
+    best: LogLevel | None = None
+    for match in _LEVEL_RE.finditer(message):
+        level = _LEVEL_BY_WORD[match.group(1).lower()]
+        if level is LogLevel.CRITICAL:
+            return level
+        if best is None or _LEVEL_RANK[level] < _LEVEL_RANK[best]:
+            best = level
+    return best
+
+
 @dataclass
 class LogEntry:
     """Represents a single log entry."""
@@ -65,7 +98,7 @@ class LogQuery:
     labels: dict[str, str] | None = None
 
     # Source-specific
-    log_group: str | None = None  # CloudWatch
+    log_group: str | list[str] | None = None  # CloudWatch
     log_stream: str | None = None  # CloudWatch
     namespace: str | None = None  # K8s/Loki
     pod: str | None = None  # K8s/Loki
@@ -1,16 +1,36 @@
 """CloudWatch Logs source implementation."""
 
-import re
+import heapq
+import random
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from typing import Any, Iterator
 
 from devctl.core.exceptions import LogsError
-from devctl.core.logs.base import LogEntry, LogLevel, LogQuery, LogSource, LogSourceFactory
+from devctl.core.logs.base import LogEntry, LogQuery, LogSource, LogSourceFactory, detect_level
 from devctl.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Log groups searched at once with FilterLogEvents
+MAX_CONCURRENT_LOG_GROUPS = 10
+
+# Log groups a single Insights query may cover
+INSIGHTS_MAX_LOG_GROUPS = 50
+
+# Insights result polling backs off from the initial to the max delay (seconds)
+INSIGHTS_POLL_INITIAL = 0.05
+INSIGHTS_POLL_MAX = 2.0
+
+# While following, remembered event IDs are trimmed back to the most
+# recent SEEN_EVENTS_KEEP once there are more than SEEN_EVENTS_MAX
+SEEN_EVENTS_MAX = 10000
+SEEN_EVENTS_KEEP = 5000
+
 
 class CloudWatchLogSource(LogSource):
     """Log source for AWS CloudWatch Logs."""
@@ -34,19 +54,24 @@ class CloudWatchLogSource(LogSource):
         return "cloudwatch"
 
     def search(self, query: LogQuery) -> list[LogEntry]:
-        """Search CloudWatch logs."""
+        """Search CloudWatch logs.
+
+        query.log_group may name several log groups; their entries are
+        merged in timestamp order.
+        """
         if not query.log_group:
             raise LogsError("log_group is required for CloudWatch search")
 
-        log_group = self._resolve_log_group(query.log_group)
+        groups = [query.log_group] if isinstance(query.log_group, str) else query.log_group
+        log_groups = [self._resolve_log_group(group) for group in groups]
         entries: list[LogEntry] = []
 
         try:
             # Use CloudWatch Logs Insights for complex queries
             if query.query:
-                entries = self._insights_query(log_group, query)
+                entries = self._insights_query(log_groups, query)
             else:
-                entries = self._filter_logs(log_group, query)
+                entries = self._filter_log_groups(log_groups, query)
 
         except Exception as e:
             raise LogsError(f"CloudWatch search failed: {e}", source="cloudwatch")
@@ -61,9 +86,12 @@ class CloudWatchLogSource(LogSource):
         """Tail CloudWatch logs."""
         if not query.log_group:
             raise LogsError("log_group is required for CloudWatch tail")
+        if not isinstance(query.log_group, str):
+            raise LogsError("CloudWatch tail takes a single log group")
 
         log_group = self._resolve_log_group(query.log_group)
-        seen_event_ids: set[str] = set()
+        # Used as an insertion-ordered set, so trimming drops the oldest IDs
+        seen_event_ids: OrderedDict[str, None] = OrderedDict()
         last_timestamp = int(query.start_time.timestamp() * 1000) if query.start_time else 0
 
         try:
@@ -86,7 +114,7 @@ class CloudWatchLogSource(LogSource):
                 for event in response.get("events", []):
                     event_id = event["eventId"]
                     if event_id not in seen_event_ids:
-                        seen_event_ids.add(event_id)
+                        seen_event_ids[event_id] = None
                         entry = self._parse_log_event(event, log_group)
                         yield entry
                         last_timestamp = max(last_timestamp, event["timestamp"])
@@ -103,8 +131,9 @@ class CloudWatchLogSource(LogSource):
                     # Move forward slightly to avoid duplicates
                     last_timestamp += 1
                     # Limit seen events set size
-                    if len(seen_event_ids) > 10000:
-                        seen_event_ids = set(list(seen_event_ids)[-5000:])
+                    if len(seen_event_ids) > SEEN_EVENTS_MAX:
+                        while len(seen_event_ids) > SEEN_EVENTS_KEEP:
+                            seen_event_ids.popitem(last=False)
 
         except Exception as e:
             raise LogsError(f"CloudWatch tail failed: {e}", source="cloudwatch")
@@ -115,6 +144,18 @@ class CloudWatchLogSource(LogSource):
             return f"{self._log_group_prefix}/{log_group}"
         return log_group
 
+    def _filter_log_groups(self, log_groups: list[str], query: LogQuery) -> list[LogEntry]:
+        """Filter several log groups concurrently, merged by timestamp."""
+        if len(log_groups) == 1:
+            return self._filter_logs(log_groups[0], query)
+
+        workers = min(len(log_groups), MAX_CONCURRENT_LOG_GROUPS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda group: self._filter_logs(group, query), log_groups))
+
+        merged = heapq.merge(*results, key=attrgetter("timestamp"))
+        return list(islice(merged, query.limit))
+
     def _filter_logs(self, log_group: str, query: LogQuery) -> list[LogEntry]:
         """Filter logs using FilterLogEvents API."""
         entries: list[LogEntry] = []
@@ -144,8 +185,12 @@ class CloudWatchLogSource(LogSource):
 
         return entries
 
-    def _insights_query(self, log_group: str, query: LogQuery) -> list[LogEntry]:
-        """Run CloudWatch Logs Insights query."""
+    def _insights_query(self, log_groups: list[str], query: LogQuery) -> list[LogEntry]:
+        """Run CloudWatch Logs Insights query.
+
+        One query is started per INSIGHTS_MAX_LOG_GROUPS log groups; all
+        of them run before any results are collected.
+        """
         # Build Insights query
         insights_query = query.query or "fields @timestamp, @message"
 
@@ -159,36 +204,69 @@ class CloudWatchLogSource(LogSource):
         start_time = query.start_time or datetime.utcnow()
         end_time = query.end_time or datetime.utcnow()
 
-        # Start query
-        response = self._client.start_query(
-            logGroupName=log_group,
-            startTime=int(start_time.timestamp()),
-            endTime=int(end_time.timestamp()),
-            queryString=insights_query,
-        )
+        chunks = [
+            log_groups[i : i + INSIGHTS_MAX_LOG_GROUPS]
+            for i in range(0, len(log_groups), INSIGHTS_MAX_LOG_GROUPS)
+        ]
+        query_ids: list[str] = []
+        entries: list[LogEntry] = []
 
-        query_id = response["queryId"]
+        try:
+            # Start queries
+            for chunk in chunks:
+                response = self._client.start_query(
+                    logGroupNames=chunk,
+                    startTime=int(start_time.timestamp()),
+                    endTime=int(end_time.timestamp()),
+                    queryString=insights_query,
+                )
+                query_ids.append(response["queryId"])
+
+            # Parse results
+            for chunk, query_id in zip(chunks, query_ids, strict=True):
+                result = self._wait_for_query(query_id)
+                for result_row in result.get("results", []):
+                    entry = self._parse_insights_result(result_row, chunk)
+                    if entry:
+                        entries.append(entry)
+        except BaseException:
+            # Don't leave queries running (and holding Insights
+            # concurrency slots) after a failure or Ctrl+C
+            self._stop_queries(query_ids)
+            raise
+
+        if len(chunks) > 1:
+            entries.sort(key=attrgetter("timestamp"))
+            del entries[query.limit :]
 
-        # Poll for results
+        return entries
+
+    def _wait_for_query(self, query_id: str) -> dict[str, Any]:
+        """Poll an Insights query until it completes.
+
+        Polling starts quickly, so short queries return promptly, and
+        backs off (with jitter) so long ones make fewer calls.
+        """
+        delay = INSIGHTS_POLL_INITIAL
         while True:
-            result = self._client.get_query_results(queryId=query_id)
+            result: dict[str, Any] = self._client.get_query_results(queryId=query_id)
             status = result["status"]
 
             if status == "Complete":
-                break
+                return result
             elif status in ("Failed", "Cancelled"):
                 raise LogsError(f"Insights query {status.lower()}")
 
-            time.sleep(0.5)
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(INSIGHTS_POLL_MAX, delay * 1.5)
 
-        # Parse results
-        entries: list[LogEntry] = []
-        for result_row in result.get("results", []):
-            entry = self._parse_insights_result(result_row, log_group)
-            if entry:
-                entries.append(entry)
-
-        return entries
+    def _stop_queries(self, query_ids: list[str]) -> None:
+        """Stop Insights queries, ignoring ones that already finished."""
+        for query_id in query_ids:
+            try:
+                self._client.stop_query(queryId=query_id)
+            except Exception as e:
+                logger.debug(f"Could not stop Insights query {query_id}: {e}")
 
     def _parse_log_event(self, event: dict[str, Any], log_group: str) -> LogEntry:
         """Parse CloudWatch log event to LogEntry."""
@@ -196,7 +274,7 @@ class CloudWatchLogSource(LogSource):
         message = event.get("message", "")
 
         # Try to detect log level
-        level = self._detect_level(message)
+        level = detect_level(message)
 
         return LogEntry(
             timestamp=timestamp,
@@ -211,10 +289,18 @@ class CloudWatchLogSource(LogSource):
         )
 
     def _parse_insights_result(
-        self, result: list[dict[str, str]], log_group: str
+        self, result: list[dict[str, str]], log_groups: list[str]
     ) -> LogEntry | None:
-        """Parse Insights query result row to LogEntry."""
+        """Parse Insights query result row to LogEntry.
+
+        With more than one log group queried, the row's group comes from
+        its @log field ("account-id:log-group") when the query returns it.
+        """
         data = {item["field"]: item["value"] for item in result}
+        if len(log_groups) == 1:
+            log_group = log_groups[0]
+        else:
+            log_group = data.get("@log", "").partition(":")[2] or ",".join(log_groups)
 
         timestamp_str = data.get("@timestamp")
         message = data.get("@message", "")
@@ -228,7 +314,7 @@ class CloudWatchLogSource(LogSource):
         except ValueError:
             timestamp = datetime.utcnow()
 
-        level = self._detect_level(message)
+        level = detect_level(message)
 
         return LogEntry(
             timestamp=timestamp,
@@ -239,24 +325,6 @@ class CloudWatchLogSource(LogSource):
             raw=data,
         )
 
-    def _detect_level(self, message: str) -> LogLevel | None:
-        """Detect log level from message content."""
-        message_lower = message.lower()
-
-        level_patterns = [
-            (LogLevel.CRITICAL, r"\b(critical|fatal|panic)\b"),
-            (LogLevel.ERROR, r"\b(error|err|exception|fail)\b"),
-            (LogLevel.WARNING, r"\b(warn|warning)\b"),
-            (LogLevel.INFO, r"\b(info)\b"),
-            (LogLevel.DEBUG, r"\b(debug|trace)\b"),
-        ]
-
-        for level, pattern in level_patterns:
-            if re.search(pattern, message_lower):
-                return level
-
-        return None
-
     def list_log_groups(self, prefix: str | None = None) -> list[dict[str, Any]]:
         """List available log groups."""
         params: dict[str, Any] = {}
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Any, Iterator
 
 from devctl.core.exceptions import LogsError
-from devctl.core.logs.base import LogEntry, LogLevel, LogQuery, LogSource, LogSourceFactory
+from devctl.core.logs.base import LogEntry, LogQuery, LogSource, LogSourceFactory, detect_level
 from devctl.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -195,7 +195,7 @@ class EKSLogSource(LogSource):
             except (ValueError, IndexError):
                 pass
 
-        level = self._detect_level(message)
+        level = detect_level(message)
 
         # Build source identifier
         source_parts = [namespace, pod]
@@ -219,25 +219,6 @@ class EKSLogSource(LogSource):
             raw={"line": line},
         )
 
-    def _detect_level(self, message: str) -> LogLevel | None:
-        """Detect log level from message."""
-        message_lower = message.lower()
-
-        # Common log format patterns
-        level_patterns = [
-            (LogLevel.CRITICAL, r"\b(critical|fatal|panic)\b"),
-            (LogLevel.ERROR, r"\b(error|err|exception|fail)\b"),
-            (LogLevel.WARNING, r"\b(warn|warning)\b"),
-            (LogLevel.INFO, r"\b(info)\b"),
-            (LogLevel.DEBUG, r"\b(debug|trace)\b"),
-        ]
-
-        for level, pattern in level_patterns:
-            if re.search(pattern, message_lower):
-                return level
-
-        return None
-
     def list_pods(
         self,
         namespace: str | None = None,
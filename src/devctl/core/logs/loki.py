@@ -1,12 +1,11 @@
 """Grafana Loki log source implementation."""
 
-import re
 import time
 from datetime import datetime
 from typing import Any, Iterator
 
 from devctl.core.exceptions import LogsError
-from devctl.core.logs.base import LogEntry, LogLevel, LogQuery, LogSource, LogSourceFactory
+from devctl.core.logs.base import LogEntry, LogQuery, LogSource, LogSourceFactory, detect_level
 from devctl.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -187,7 +186,7 @@ class LokiLogSource(LogSource):
         message = value[1]
 
         timestamp = datetime.fromtimestamp(timestamp_ns / 1e9)
-        level = self._detect_level(message)
+        level = detect_level(message)
 
         # Build source from labels
         source_parts = []
@@ -209,24 +208,6 @@ class LokiLogSource(LogSource):
             raw={"timestamp_ns": timestamp_ns, "line": message},
         )
 
-    def _detect_level(self, message: str) -> LogLevel | None:
-        """Detect log level from message."""
-        message_lower = message.lower()
-
-        level_patterns = [
-            (LogLevel.CRITICAL, r"\b(critical|fatal|panic)\b"),
-            (LogLevel.ERROR, r"\b(error|err|exception|fail)\b"),
-            (LogLevel.WARNING, r"\b(warn|warning)\b"),
-            (LogLevel.INFO, r"\b(info)\b"),
-            (LogLevel.DEBUG, r"\b(debug|trace)\b"),
-        ]
-
-        for level, pattern in level_patterns:
-            if re.search(pattern, message_lower):
-                return level
-
-        return None
-
     def get_labels(self) -> list[str]:
         """Get available label names."""
         datasource_uid = self._datasource_uid or self._find_loki_datasource()
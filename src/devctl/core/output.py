@@ -2,14 +2,17 @@
 
 import json
 import sys
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from typing import Any
+from itertools import chain
+from typing import Any, NamedTuple, cast
 
 import yaml
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from tabulate import tabulate
 
@@ -46,6 +49,16 @@ class OutputFormatter:
             return
         self._console.print(message, style=style)
 
+    def print_ansi(self, text: str) -> None:
+        """Print external tool output, keeping its ANSI colors.
+
+        The text is not parsed for Rich markup, so brackets in tool output
+        (e.g. ``[id=i-123]``) are printed verbatim.
+        """
+        if self.quiet:
+            return
+        self._console.print(Text.from_ansi(text.rstrip("\n")))
+
     def print_error(self, message: str) -> None:
         """Print an error message to stderr."""
         error_console.print(f"[red]Error:[/red] {message}")
@@ -68,6 +81,12 @@ class OutputFormatter:
             return
         self._console.print(f"[blue]ℹ[/blue] {message}")
 
+    def print_header(self, message: str) -> None:
+        """Print a section header."""
+        if self.quiet:
+            return
+        self._console.rule(f"[bold]{message}[/bold]", align="left")
+
     def print_data(
         self,
         data: list[dict[str, Any]] | dict[str, Any],
@@ -84,6 +103,82 @@ class OutputFormatter:
         else:
             self._print_table(data, headers, title)
 
+    def print_table(
+        self,
+        rows: Iterable[dict[str, Any]] | Iterable[tuple[Any, ...]],
+        columns: list[str] | None = None,
+        title: str | None = None,
+    ) -> None:
+        """Print a list of records in the configured format.
+
+        Rows may be dicts or namedtuples, from any iterable. In table format
+        rows are pulled one at a time straight into the table, so callers
+        can pass a generator instead of building a list first. Namedtuple
+        rows are only converted to dicts for structured (JSON/YAML/raw)
+        output.
+        """
+        rows_iter = iter(rows)
+        first = next(rows_iter, None)
+        if first is None:
+            self.print_data([], headers=columns, title=title)
+            return
+
+        all_rows = chain((first,), rows_iter)
+        if hasattr(first, "_fields"):
+            self._print_tuple_rows(cast(Iterator[NamedTuple], all_rows), columns, title)
+        else:
+            self._print_dict_rows(cast(Iterator[dict[str, Any]], all_rows), columns, title)
+
+    def _print_tuple_rows(
+        self,
+        rows: Iterator[NamedTuple],
+        columns: list[str] | None,
+        title: str | None,
+    ) -> None:
+        """Print namedtuple rows (at least one) in the configured format."""
+        if self.format != OutputFormat.TABLE:
+            self.print_data([row._asdict() for row in rows], headers=columns, title=title)
+            return
+
+        first = next(rows)
+        fields = first._fields
+        columns = columns or list(fields)
+        indices = [fields.index(column) for column in columns]
+        cells = ([str(row[i]) for i in indices] for row in chain((first,), rows))
+        self._print_row_table(columns, cells, title)
+
+    def _print_dict_rows(
+        self,
+        rows: Iterator[dict[str, Any]],
+        columns: list[str] | None,
+        title: str | None,
+    ) -> None:
+        """Print dict rows (at least one) in the configured format."""
+        if self.format != OutputFormat.TABLE:
+            self.print_data(list(rows), headers=columns, title=title)
+            return
+
+        first = next(rows)
+        columns = columns or list(first.keys())
+        cells = ([str(row.get(c, "")) for c in columns] for row in chain((first,), rows))
+        self._print_row_table(columns, cells, title)
+
+    def _print_row_table(
+        self,
+        columns: list[str],
+        cells: Iterable[list[str]],
+        title: str | None = None,
+    ) -> None:
+        """Print pre-rendered row cells as a formatted table."""
+        table = Table(title=title, show_header=True, header_style="bold cyan")
+        for column in columns:
+            table.add_column(column)
+
+        for row in cells:
+            table.add_row(*row)
+
+        self._console.print(table)
+
     def _print_json(self, data: Any) -> None:
         """Print data as JSON."""
         if self.color:
@@ -1,11 +1,24 @@
 """Common utilities for devctl."""
 
+import json
 import os
 import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - optional speedup
+    _parse_iso = datetime.fromisoformat
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def parse_duration(duration_str: str) -> timedelta:
     """Parse duration string to timedelta.
@@ -79,6 +92,63 @@ def parse_time(time_str: str) -> datetime:
         raise ValueError(f"Invalid time format: {time_str}")
 
 
+def format_timestamp(timestamp: str | None, fmt: str = "%Y-%m-%d %H:%M") -> str:
+    """Format an ISO 8601 timestamp for display.
+
+    Uses ciso8601 when installed, falling back to datetime.fromisoformat.
+
+    Args:
+        timestamp: ISO 8601 timestamp string
+        fmt: strftime format for the result
+
+    Returns:
+        Formatted timestamp, "" for empty input, or the input unchanged
+        if it cannot be parsed
+    """
+    if not timestamp:
+        return ""
+    try:
+        parsed: datetime = _parse_iso(timestamp)
+    except ValueError:
+        return timestamp
+    return parsed.strftime(fmt)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Uses orjson when installed, falling back to the standard library.
+    Both raise a ValueError subclass on malformed input.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed value
+    """
+    return _json_loads(data)
+
+
+def json_dumps_pretty(value: Any) -> str:
+    """Serialize a value as JSON indented by two spaces.
+
+    Uses orjson when installed, falling back to the standard library
+    (also for values orjson rejects, such as integers over 64 bits).
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
 def get_config_dir() -> Path:
     """Get the devctl config directory."""
     config_dir = Path(os.environ.get("DEVCTL_CONFIG_DIR", "~/.devctl")).expanduser()
@@ -139,8 +209,8 @@ def parse_key_value_pairs(pairs: list[str]) -> dict[str, str]:
     """
     result = {}
     for pair in pairs:
-        if "=" in pair:
-            key, value = pair.split("=", 1)
+        key, sep, value = pair.partition("=")
+        if sep:
             result[key.strip()] = value.strip()
     return result
 
@@ -160,12 +230,9 @@ def parse_tags(tag_strings: list[str]) -> dict[str, str]:
     """
     tags = {}
     for tag_str in tag_strings:
-        if "=" in tag_str:
-            key, value = tag_str.split("=", 1)
-        elif ":" in tag_str:
-            key, value = tag_str.split(":", 1)
-        else:
-            key, value = tag_str, ""
+        key, sep, value = tag_str.partition("=")
+        if not sep:
+            key, _, value = tag_str.partition(":")
         tags[key.strip()] = value.strip()
     return tags
 
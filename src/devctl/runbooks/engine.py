@@ -1,5 +1,6 @@
 """Runbook execution engine."""
 
+import copy
 import os
 import re
 import subprocess
@@ -10,6 +11,11 @@ from typing import Any, Callable
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
 from devctl.core.exceptions import RunbookError
 from devctl.core.logging import get_logger
 from devctl.runbooks.schema import (
@@ -24,6 +30,9 @@ from devctl.runbooks.markdown_parser import MarkdownRunbookParser
 
 logger = get_logger(__name__)
 
+# File extensions recognized by list_runbooks
+RUNBOOK_EXTENSIONS = (".yaml", ".yml", ".md")
+
 
 class RunbookEngine:
     """Execute runbooks with variable substitution and step control."""
@@ -46,6 +55,23 @@ class RunbookEngine:
         self._output_handler = output_handler
         self._markdown_parser = MarkdownRunbookParser()
 
+    def with_handlers(
+        self,
+        prompt_handler: Callable[[str, str, list[str] | None], str | bool] | None = None,
+        notify_handler: Callable[[str, str], None] | None = None,
+        output_handler: Callable[[str, str], None] | None = None,
+    ) -> "RunbookEngine":
+        """Return a copy of this engine bound to different handlers.
+
+        The copy shares parsers with the original, so a long-lived engine can
+        be reused for runs whose handlers close over per-invocation state.
+        """
+        engine = copy.copy(self)
+        engine._prompt_handler = prompt_handler
+        engine._notify_handler = notify_handler
+        engine._output_handler = output_handler
+        return engine
+
     def load(self, file_path: str | Path) -> Runbook:
         """Load a runbook from file.
 
@@ -57,9 +83,6 @@ class RunbookEngine:
         """
         path = Path(file_path)
 
-        if not path.exists():
-            raise RunbookError(f"Runbook file not found: {path}")
-
         if path.suffix in (".yaml", ".yml"):
             return self._load_yaml(path)
         elif path.suffix == ".md":
@@ -69,8 +92,11 @@ class RunbookEngine:
 
     def _load_yaml(self, path: Path) -> Runbook:
         """Load YAML runbook."""
-        content = path.read_text()
-        data = yaml.safe_load(content)
+        try:
+            with path.open("rb") as f:
+                data = yaml.load(f, Loader=YAMLLoader)
+        except FileNotFoundError:
+            raise RunbookError(f"Runbook file not found: {path}")
 
         if not data:
             raise RunbookError(f"Empty runbook file: {path}")
@@ -542,23 +568,33 @@ class RunbookEngine:
 
     def list_runbooks(self, directory: str | Path) -> list[dict[str, Any]]:
         """List available runbooks in a directory."""
-        directory = Path(directory)
         runbooks: list[dict[str, Any]] = []
 
-        for pattern in ("*.yaml", "*.yml", "*.md"):
-            for path in directory.glob(pattern):
-                try:
-                    rb = self.load(path)
-                    runbooks.append({
-                        "name": rb.name,
-                        "description": rb.description,
-                        "version": rb.version,
-                        "author": rb.author,
-                        "file": str(path),
-                        "steps": len(rb.steps),
-                        "tags": rb.tags,
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to load runbook {path}: {e}")
+        # One scandir pass instead of a glob per extension; DirEntry carries
+        # the file type from readdir, so is_file() needs no extra stat.
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(RUNBOOK_EXTENSIONS) and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return runbooks
+
+        for entry in entries:
+            path = Path(entry.path)
+            try:
+                rb = self.load(path)
+                runbooks.append({
+                    "name": rb.name,
+                    "description": rb.description,
+                    "version": rb.version,
+                    "author": rb.author,
+                    "file": str(path),
+                    "steps": len(rb.steps),
+                    "tags": rb.tags,
+                })
+            except Exception as e:
+                logger.warning(f"Failed to load runbook {path}: {e}")
 
         return runbooks
@@ -6,6 +6,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
 from devctl.core.exceptions import RunbookError
 from devctl.runbooks.schema import Runbook, RunbookStep, StepType
 
@@ -61,10 +66,11 @@ class MarkdownRunbookParser:
     def parse_file(self, file_path: str | Path) -> Runbook:
         """Parse a Markdown runbook file."""
         path = Path(file_path)
-        if not path.exists():
+        try:
+            content = path.read_text()
+        except FileNotFoundError:
             raise RunbookError(f"Runbook file not found: {path}")
 
-        content = path.read_text()
         runbook = self.parse(content)
         runbook.source_file = str(path)
         return runbook
@@ -76,7 +82,7 @@ class MarkdownRunbookParser:
         fm_match = self.FRONTMATTER_PATTERN.match(content)
         if fm_match:
             try:
-                frontmatter = yaml.safe_load(fm_match.group(1)) or {}
+                frontmatter = yaml.load(fm_match.group(1), Loader=YAMLLoader) or {}
             except yaml.YAMLError:
                 pass
             content = content[fm_match.end() :].strip()
@@ -153,7 +159,7 @@ class MarkdownRunbookParser:
             if default:
                 # Try to parse as YAML value
                 try:
-                    variables[var_name] = yaml.safe_load(default)
+                    variables[var_name] = yaml.load(default, Loader=YAMLLoader)
                 except yaml.YAMLError:
                     variables[var_name] = default
             else:
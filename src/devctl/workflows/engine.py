@@ -2,7 +2,9 @@
 
 import re
 import shlex
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import Any
 
 import yaml
@@ -24,6 +26,108 @@ from devctl.workflows.schema import (
 logger = get_logger(__name__)
 
 
+# devctl terraform commands whose targeted steps can share one run
+COALESCE_COMMANDS = ("terraform apply", "terraform plan")
+
+
+def coalesce_terraform_steps(workflow: WorkflowSchema) -> WorkflowSchema:
+    """Merge runs of adjacent targeted terraform steps into single steps.
+
+    Consecutive `terraform apply` (or `terraform plan`) steps that set a
+    `target` param and agree on everything else become one step with all
+    the targets, so terraform walks the graph and writes state once
+    instead of once per step. The merged step is named after the steps it
+    replaces, joined with " + ".
+
+    Workflows are left alone when they use depends_on, or when any step
+    template mentions `results`, since merged steps no longer record a
+    result under their original names.
+    """
+    steps = workflow.steps
+    if any(step.depends_on for step in steps) or any(
+        "results" in _step_templates(step) for step in steps
+    ):
+        return workflow
+
+    merged: list[WorkflowStepSchema] = []
+    group: list[WorkflowStepSchema] = []
+
+    def flush() -> None:
+        if len(group) > 1:
+            targets = [t for step in group for t in _step_targets(step)]
+            merged.append(
+                group[0].model_copy(
+                    update={
+                        "name": " + ".join(step.name for step in group),
+                        "params": {**group[0].params, "target": targets},
+                    }
+                )
+            )
+        else:
+            merged.extend(group)
+        group.clear()
+
+    for step in steps:
+        if not _coalescible(step):
+            flush()
+            merged.append(step)
+            continue
+        if group and _coalesce_key(step) != _coalesce_key(group[0]):
+            flush()
+        group.append(step)
+    flush()
+
+    if len(merged) == len(steps):
+        return workflow
+    return workflow.model_copy(update={"steps": merged})
+
+
+def _coalescible(step: WorkflowStepSchema) -> bool:
+    """Whether a step is a plain targeted terraform apply/plan."""
+    if step.command is None or step.parallel is not None:
+        return False
+    command = " ".join(step.command.split())
+    if command not in COALESCE_COMMANDS:
+        return False
+    if step.condition or step.retries or not _step_targets(step):
+        return False
+    # A saved plan would change from one target's plan to all of them
+    if command == "terraform plan" and "out" in step.params:
+        return False
+    # Templated steps may render differently once earlier steps have run
+    templates = _step_templates(step)
+    return "{{" not in templates and "{%" not in templates
+
+
+def _coalesce_key(step: WorkflowStepSchema) -> tuple[Any, ...]:
+    """Everything that must match for two steps to be merged.
+
+    Only called for steps that passed _coalescible, so command is set.
+    """
+    assert step.command is not None
+    params = {k: v for k, v in step.params.items() if k != "target"}
+    return (" ".join(step.command.split()), step.on_failure, step.timeout, repr(sorted(params.items())))
+
+
+def _step_targets(step: WorkflowStepSchema) -> list[str]:
+    """The step's `target` param as a list."""
+    target = step.params.get("target")
+    if not target:
+        return []
+    return [str(t) for t in target] if isinstance(target, list) else [str(target)]
+
+
+def _step_templates(step: WorkflowStepSchema) -> str:
+    """The step's templated text: command, condition and params."""
+    return f"{step.command or ''}\0{step.condition or ''}\0{step.params!r}"
+
+
+@lru_cache(maxsize=1)
+def _devctl_bin() -> str:
+    """Path of the devctl executable, looked up on PATH once per process."""
+    return shutil.which("devctl") or "devctl"
+
+
 class WorkflowEngine:
     """Engine for executing YAML-defined workflows."""
 
@@ -33,11 +137,12 @@ class WorkflowEngine:
         self._variables: dict[str, Any] = {}
         self._results: dict[str, Any] = {}
 
-    def load_workflow(self, workflow_path: str) -> WorkflowSchema:
+    def load_workflow(self, workflow_path: str, coalesce: bool = True) -> WorkflowSchema:
         """Load and validate a workflow from a YAML file.
 
         Args:
             workflow_path: Path to workflow YAML file
+            coalesce: Merge adjacent targeted terraform steps (see load_workflow_dict)
 
         Returns:
             Validated workflow schema
@@ -46,13 +151,31 @@ class WorkflowEngine:
             with open(workflow_path) as f:
                 workflow_dict = yaml.safe_load(f)
 
-            return validate_workflow(workflow_dict)
-
         except yaml.YAMLError as e:
             raise WorkflowError(f"Invalid YAML: {e}")
         except Exception as e:
             raise WorkflowError(f"Failed to load workflow: {e}")
 
+        return self.load_workflow_dict(workflow_dict, coalesce=coalesce)
+
+    def load_workflow_dict(self, workflow_dict: dict[str, Any], coalesce: bool = True) -> WorkflowSchema:
+        """Validate an already-parsed workflow definition.
+
+        Args:
+            workflow_dict: Workflow definition, e.g. built from config
+            coalesce: Merge adjacent `terraform apply`/`terraform plan` steps
+                that differ only in their targets into one terraform run
+
+        Returns:
+            Validated workflow schema
+        """
+        try:
+            workflow = validate_workflow(workflow_dict)
+        except Exception as e:
+            raise WorkflowError(f"Failed to load workflow: {e}")
+
+        return coalesce_terraform_steps(workflow) if coalesce else workflow
+
     def run(
         self,
         workflow: WorkflowSchema,
@@ -306,7 +429,7 @@ class WorkflowEngine:
 
         This invokes devctl as a subprocess for isolation.
         """
-        cmd_parts = ["devctl"] + command.split()
+        cmd_parts = [_devctl_bin(), *command.split()]
 
         for key, value in params.items():
             if isinstance(value, bool):
@@ -318,7 +441,7 @@ class WorkflowEngine:
             else:
                 cmd_parts.extend([f"--{key}", str(value)])
 
-        self.ctx.output.print(f"[dim]> {' '.join(cmd_parts)}[/dim]")
+        self.ctx.output.print(f"[dim]> devctl {' '.join(cmd_parts[1:])}[/dim]")
 
         try:
             result = subprocess.run(
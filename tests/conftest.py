@@ -1,6 +1,7 @@
 """Pytest fixtures for devctl tests."""
 
 import os
+from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
@@ -23,6 +24,7 @@ from devctl.config import (
     LogsConfig,
     DeployConfig,
     ComplianceConfig,
+    _env,
 )
 from devctl.core.context import DevCtlContext
 from devctl.core.output import OutputFormat
@@ -179,6 +181,22 @@ def clean_env() -> Generator[None, None, None]:
             os.environ.pop(k, None)
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch) -> Path:
+    """Point the devctl cache at a per-test directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("DEVCTL_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_env_lookups() -> Generator[None, None, None]:
+    """Forget cached config environment lookups, as a config reload would."""
+    _env.cache_clear()
+    yield
+    _env.cache_clear()
+
+
 @pytest.fixture
 def temp_config_file(tmp_path):
     """Create a temporary config file."""
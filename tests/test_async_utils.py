@@ -0,0 +1,135 @@
+"""Tests for async utilities."""
+
+import asyncio
+import threading
+import time
+from itertools import pairwise
+
+import pytest
+
+from devctl.core.async_utils import (
+    RateLimiter,
+    _bridge_loop,
+    gather_with_concurrency,
+    map_async,
+    run_sync,
+)
+
+
+async def _double(x: int) -> int:
+    return x * 2
+
+
+async def _double_after(x: int, delay: float) -> int:
+    await asyncio.sleep(delay)
+    return x * 2
+
+
+class TestGatherWithConcurrency:
+    """Tests for gather_with_concurrency and map_async."""
+
+    async def test_results_in_input_order(self):
+        # Later items finish first, with fewer workers than items
+        delays = [0.04, 0.03, 0.02, 0.01, 0.0]
+        coros = [_double_after(i, d) for i, d in enumerate(delays)]
+
+        assert await gather_with_concurrency(2, *coros) == [0, 2, 4, 6, 8]
+
+    async def test_limits_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def track(x: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return x
+
+        assert await gather_with_concurrency(3, *[track(i) for i in range(10)]) == list(range(10))
+        assert peak == 3
+
+    async def test_n_larger_than_count(self):
+        assert await gather_with_concurrency(10, _double_after(1, 0), _double_after(2, 0)) == [2, 4]
+
+    async def test_empty_input(self):
+        assert await gather_with_concurrency(5) == []
+        assert await map_async(_double, []) == []
+
+    async def test_map_async_accepts_generator(self):
+        items = (i for i in range(5))
+
+        assert await map_async(_double, items, concurrency=2) == [0, 2, 4, 6, 8]
+
+    async def test_first_error_reraised_after_others_complete(self):
+        completed = []
+
+        async def work(x: int) -> int:
+            await asyncio.sleep(0.01 * x)
+            if x in (1, 3):
+                raise ValueError(f"item {x}")
+            completed.append(x)
+            return x
+
+        with pytest.raises(ValueError, match="item 1"):
+            await gather_with_concurrency(2, *[work(i) for i in range(5)])
+
+        assert sorted(completed) == [0, 2, 4]
+
+
+class TestRunSync:
+    """Tests for run_sync."""
+
+    def test_without_running_loop(self):
+        assert run_sync(_double(2)) == 4
+
+    async def test_inside_running_loop_uses_bridge_loop(self):
+        async def loop_thread() -> str:
+            assert asyncio.get_running_loop() is _bridge_loop()
+            return threading.current_thread().name
+
+        assert run_sync(_double(3)) == 6
+        assert run_sync(loop_thread()) == "devctl-bridge"
+
+    async def test_reentrant_from_bridge_loop(self):
+        async def nested() -> int:
+            # Already on the bridge loop, which cannot wait on itself
+            return run_sync(_double(5))
+
+        assert run_sync(nested()) == 10
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    # Allowance for timer granularity when comparing sleep durations
+    SLACK = 0.005
+
+    async def test_concurrent_acquires_spaced_by_interval(self):
+        limiter = RateLimiter(calls_per_second=50)
+        times: list[float] = []
+
+        async def call() -> None:
+            await limiter.acquire()
+            times.append(time.monotonic())
+
+        await asyncio.gather(*[call() for _ in range(5)])
+
+        gaps = [b - a for a, b in pairwise(times)]
+        assert all(gap >= limiter.min_interval - self.SLACK for gap in gaps)
+
+    async def test_cancelled_waiter_keeps_its_slot(self):
+        limiter = RateLimiter(calls_per_second=20)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # The next caller gets the slot after the cancelled one
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 2 * limiter.min_interval - self.SLACK
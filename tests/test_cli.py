@@ -378,6 +378,19 @@ class TestRunbookCommands:
         assert "list" in result.output
         assert "validate" in result.output
 
+    def test_runbook_validate_directory(self, cli_runner: CliRunner, tmp_path):
+        """Test validating a directory reports an error instead of crashing."""
+        result = cli_runner.invoke(cli, ["runbook", "validate", str(tmp_path)])
+        assert result.exit_code != 0
+        assert "Validation failed" in result.output
+        assert not isinstance(result.exception, IsADirectoryError)
+
+    def test_runbook_list_missing_directory(self, cli_runner: CliRunner, tmp_path):
+        """Test listing a missing directory finds no runbooks."""
+        result = cli_runner.invoke(cli, ["runbook", "list", "-d", str(tmp_path / "missing")])
+        assert result.exit_code == 0
+        assert "No runbooks found" in result.output
+
 
 class TestDeployCommands:
     """Tests for Deploy command group."""
@@ -48,6 +48,53 @@ class TestPagerDutyClient:
         assert result[0]["id"] == "INC001"
         mock_request.assert_called_once()
 
+    @patch("devctl.clients.pagerduty.PagerDutyClient._request_async")
+    @patch("devctl.clients.pagerduty.PagerDutyClient._request")
+    def test_list_incidents_fetches_remaining_pages(
+        self, mock_request, mock_request_async, pd_config
+    ):
+        """Test pages after the first are fetched up to the limit."""
+        from devctl.clients.pagerduty import PagerDutyClient
+
+        mock_request.return_value = {
+            "incidents": [{"id": f"INC{i:03d}"} for i in range(100)],
+            "total": 250,
+            "more": True,
+        }
+
+        async def page(_client, _method, _path, params):
+            offset = params["offset"]
+            return {
+                "incidents": [
+                    {"id": f"INC{i:03d}"} for i in range(offset, offset + params["limit"])
+                ]
+            }
+
+        mock_request_async.side_effect = page
+
+        client = PagerDutyClient(pd_config)
+        result = client.list_incidents(limit=230)
+
+        assert len(result) == 230
+        assert [r["id"] for r in result] == [f"INC{i:03d}" for i in range(230)]
+        assert mock_request_async.call_count == 2
+
+    @patch("devctl.clients.pagerduty.PagerDutyClient._request")
+    def test_get_service_is_cached(self, mock_request, pd_config):
+        """Test repeated service lookups hit the cache until invalidated."""
+        from devctl.clients.pagerduty import PagerDutyClient
+
+        mock_request.return_value = {"service": {"id": "PSVC1", "status": "active"}}
+
+        client = PagerDutyClient(pd_config)
+        assert client.get_service("PSVC1")["status"] == "active"
+        assert client.get_service("PSVC1")["status"] == "active"
+        assert mock_request.call_count == 1
+
+        client.invalidate("PSVC1")
+        client.get_service("PSVC1")
+        assert mock_request.call_count == 2
+
     @patch("devctl.clients.pagerduty.PagerDutyClient._request")
     def test_create_incident(self, mock_request, pd_config):
         """Test creating an incident."""
@@ -172,6 +219,56 @@ class TestSlackClient:
         assert len(result["channels"]) == 1
         mock_request.assert_called_once()
 
+    @patch("devctl.clients.slack.SlackClient._request")
+    def test_list_channels_is_cached(self, mock_request, slack_config):
+        """Test channel listings are served from the disk cache."""
+        from devctl.clients.slack import SlackClient
+
+        mock_request.return_value = {
+            "ok": True,
+            "channels": [{"id": "C12345", "name": "test"}],
+            "response_metadata": {"next_cursor": ""},
+        }
+
+        client = SlackClient(slack_config)
+        first = client.list_channels()
+        second = client.list_channels()
+
+        assert first == second
+        mock_request.assert_called_once()
+
+        client.invalidate_cache("conversations.list")
+        client.list_channels()
+        assert mock_request.call_count == 2
+
+    @patch("devctl.clients.slack.SlackClient._request")
+    def test_iter_users_filters_across_pages(self, mock_request, slack_config):
+        """Test iter_users skips bots/deleted users and follows the cursor."""
+        from devctl.clients.slack import SlackClient
+
+        mock_request.side_effect = [
+            {
+                "ok": True,
+                "members": [
+                    {"id": "U1", "is_bot": True},
+                    {"id": "U2"},
+                    {"id": "U3", "deleted": True},
+                ],
+                "response_metadata": {"next_cursor": "next"},
+            },
+            {
+                "ok": True,
+                "members": [{"id": "U4"}, {"id": "U5"}],
+                "response_metadata": {"next_cursor": "more"},
+            },
+        ]
+
+        client = SlackClient(slack_config)
+        users = list(client.iter_users(limit=2))
+
+        assert [u["id"] for u in users] == ["U2", "U4"]
+        assert mock_request.call_count == 2
+
 
 class TestConfluenceClient:
     """Tests for Confluence client."""
@@ -168,6 +168,61 @@ class TestConfigLoader:
         with pytest.raises(ConfigError):
             loader.load("/nonexistent/config.yaml")
 
+    def test_load_toml_file(self, tmp_path: Path):
+        config_file = tmp_path / "devctl.toml"
+        config_file.write_text(
+            '[global]\noutput_format = "json"\n\n'
+            '[profiles.default.aws]\nprofile = "test"\nregion = "us-east-1"\n'
+        )
+
+        config = ConfigLoader().load(str(config_file))
+
+        assert config.global_settings.output_format == OutputFormat.JSON
+        assert config.profiles["default"].aws.region == "us-east-1"
+
+    def test_load_invalid_toml(self, tmp_path: Path):
+        config_file = tmp_path / "devctl.toml"
+        config_file.write_text("global = [")
+
+        with pytest.raises(ConfigError):
+            ConfigLoader().load(str(config_file))
+
+    def test_load_json_file(self, tmp_path: Path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"global": {"output_format": "json"}}')
+
+        config = ConfigLoader().load(str(config_file))
+        assert config.global_settings.output_format == OutputFormat.JSON
+
+    def test_load_invalid_json(self, tmp_path: Path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"global": ')
+
+        with pytest.raises(ConfigError):
+            ConfigLoader().load(str(config_file))
+
+    def test_reload_picks_up_edits(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"global": {"output_format": "json"}}))
+
+        loader = ConfigLoader()
+        assert loader.load(str(config_file)).global_settings.output_format == OutputFormat.JSON
+
+        # Different size, so the edit is seen even with a coarse mtime
+        config_file.write_text(yaml.dump({"global": {"output_format": "table"}}))
+        assert loader.load(str(config_file)).global_settings.output_format == OutputFormat.TABLE
+
+    def test_load_reuses_config_until_reload(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"global": {"output_format": "json"}}))
+
+        loader = ConfigLoader()
+        config = loader.load(str(config_file))
+        assert loader.load(str(config_file)) is config
+
+        loader.reload()
+        assert loader.load(str(config_file)) is not config
+
 
 class TestConfigFunctions:
     """Tests for config module functions."""
@@ -0,0 +1,87 @@
+"""Tests for the CloudWatch log source."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from devctl.core.exceptions import LogsError
+from devctl.core.logs.base import LogQuery
+from devctl.core.logs.cloudwatch import CloudWatchLogSource
+
+
+def _filter_client(events_by_group: dict[str, list[int]]) -> MagicMock:
+    """Client whose filter_log_events paginator returns events at the given ms timestamps."""
+    client = MagicMock()
+
+    def paginate(**params):
+        group = params["logGroupName"]
+        return [{
+            "events": [
+                {"eventId": f"{group}-{ts}", "timestamp": ts, "message": f"{group} {ts}"}
+                for ts in events_by_group[group]
+            ]
+        }]
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    return client
+
+
+class TestCloudWatchSearch:
+    """Tests for multi-log-group search."""
+
+    def test_filter_merges_groups_by_timestamp(self):
+        client = _filter_client({"/a": [1000, 3000, 5000], "/b": [2000, 4000]})
+        source = CloudWatchLogSource(client)
+
+        entries = source.search(LogQuery(log_group=["/a", "/b"]))
+
+        assert [e.timestamp.timestamp() for e in entries] == [1, 2, 3, 4, 5]
+        assert [e.source for e in entries[:2]] == ["cloudwatch:/a", "cloudwatch:/b"]
+
+    def test_filter_honours_limit(self):
+        client = _filter_client({"/a": [1000, 3000, 5000], "/b": [2000, 4000]})
+        source = CloudWatchLogSource(client)
+
+        entries = source.search(LogQuery(log_group=["/a", "/b"], limit=3))
+
+        assert [e.timestamp.timestamp() for e in entries] == [1, 2, 3]
+
+    def test_insights_attributes_rows_by_log_field(self):
+        client = MagicMock()
+        client.start_query.return_value = {"queryId": "q1"}
+        client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [[
+                {"field": "@timestamp", "value": "2024-01-01T00:00:00Z"},
+                {"field": "@message", "value": "boom"},
+                {"field": "@log", "value": "123456789012:/b"},
+            ]],
+        }
+        source = CloudWatchLogSource(client)
+
+        entries = source.search(LogQuery(log_group=["/a", "/b"], query="filter @message like /boom/"))
+
+        assert client.start_query.call_args.kwargs["logGroupNames"] == ["/a", "/b"]
+        assert [e.source for e in entries] == ["cloudwatch:/b"]
+
+    def test_insights_failure_stops_started_queries(self, monkeypatch):
+        monkeypatch.setattr("devctl.core.logs.cloudwatch.INSIGHTS_MAX_LOG_GROUPS", 1)
+        client = MagicMock()
+        client.start_query.side_effect = [{"queryId": "q1"}, {"queryId": "q2"}]
+        client.get_query_results.side_effect = [
+            {"status": "Complete", "results": []},
+            {"status": "Failed"},
+        ]
+        source = CloudWatchLogSource(client)
+
+        with pytest.raises(LogsError):
+            source.search(LogQuery(log_group=["/a", "/b"], query="fields @message"))
+
+        stopped = [call.kwargs["queryId"] for call in client.stop_query.call_args_list]
+        assert stopped == ["q1", "q2"]
+
+    def test_tail_rejects_several_groups(self):
+        source = CloudWatchLogSource(MagicMock())
+
+        with pytest.raises(LogsError):
+            list(source.tail(LogQuery(log_group=["/a", "/b"])))
@@ -1,6 +1,7 @@
 """Tests for output formatting utilities."""
 
 import json
+from collections import namedtuple
 
 import pytest
 import yaml
@@ -142,6 +143,35 @@ class TestOutputFormatter:
         assert "item2" in captured.out
         assert "item3" in captured.out
 
+    def test_print_table_namedtuple_rows(self, capsys):
+        Row = namedtuple("Row", "id name")
+        formatter = OutputFormatter(color=False)
+        formatter.print_table([Row("P1", "api"), Row("P2", "web")], columns=["name"])
+        captured = capsys.readouterr()
+        assert "api" in captured.out
+        assert "web" in captured.out
+        assert "P1" not in captured.out
+
+    def test_print_table_namedtuple_rows_json(self, capsys):
+        Row = namedtuple("Row", "id name")
+        formatter = OutputFormatter(format=OutputFormat.JSON, color=False)
+        formatter.print_table([Row("P1", "api")], columns=["id", "name"])
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == [{"id": "P1", "name": "api"}]
+
+    def test_print_table_generator_rows(self, capsys):
+        formatter = OutputFormatter(color=False)
+        formatter.print_table(({"name": n} for n in ["api", "web"]), columns=["name"])
+        captured = capsys.readouterr()
+        assert "api" in captured.out
+        assert "web" in captured.out
+
+    def test_print_table_empty_generator(self, capsys):
+        formatter = OutputFormatter(format=OutputFormat.JSON, color=False)
+        formatter.print_table(iter([]))
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == []
+
 
 class TestOutputFormat:
     """Tests for OutputFormat enum."""
@@ -365,6 +365,44 @@ class TestWorkflowEngineLoadWorkflow:
         with pytest.raises(WorkflowError):
             workflow_engine.load_workflow("/nonexistent/workflow.yaml")
 
+    def test_load_workflow_dict(self, workflow_engine):
+        workflow = workflow_engine.load_workflow_dict(
+            {"name": "from-config", "steps": [{"name": "step1", "command": "!echo test"}]}
+        )
+        assert workflow.name == "from-config"
+        assert len(workflow.steps) == 1
+
+    def test_load_workflow_dict_invalid(self, workflow_engine):
+        with pytest.raises(WorkflowError):
+            workflow_engine.load_workflow_dict({"steps": "not-a-list"})
+
+    def test_load_workflow_dict_coalesces_terraform_targets(self, workflow_engine):
+        workflow_dict = {
+            "steps": [
+                {"name": "vpc", "command": "terraform apply", "params": {"target": "module.vpc", "auto-approve": True}},
+                {"name": "db", "command": "terraform apply", "params": {"target": "module.db", "auto-approve": True}},
+                {"name": "notify", "command": "!echo done"},
+            ]
+        }
+        workflow = workflow_engine.load_workflow_dict(workflow_dict)
+        assert [s.name for s in workflow.steps] == ["vpc + db", "notify"]
+        assert workflow.steps[0].params == {"target": ["module.vpc", "module.db"], "auto-approve": True}
+
+        workflow = workflow_engine.load_workflow_dict(workflow_dict, coalesce=False)
+        assert len(workflow.steps) == 3
+
+    def test_load_workflow_dict_keeps_differing_terraform_steps(self, workflow_engine):
+        workflow = workflow_engine.load_workflow_dict(
+            {
+                "steps": [
+                    {"name": "vpc", "command": "terraform apply", "params": {"target": "module.vpc"}},
+                    {"name": "db", "command": "terraform apply", "params": {"target": "module.db", "auto-approve": True}},
+                    {"name": "all", "command": "terraform apply", "params": {"auto-approve": True}},
+                ]
+            }
+        )
+        assert [s.name for s in workflow.steps] == ["vpc", "db", "all"]
+
 
 class TestWorkflowEngineStepConditions:
     """Tests for conditional step execution."""